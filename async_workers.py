@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, List, Optional, Sequence
 
 from PyQt5.QtCore import QObject, pyqtSignal, QRunnable
 
@@ -16,25 +16,64 @@ class WorkerSignals(QObject):
 class WorkerRunnable(QRunnable):
     """
     Generic QRunnable wrapper to execute a callable off the UI thread.
+
+    The WorkerSignals QObject is created on first access of ``signals`` (or
+    passed in by the caller), so fire-and-forget jobs never pay for one.
     """
 
-    def __init__(self, fn: Callable, *args, **kwargs):
+    def __init__(self, fn: Callable, *args, signals: Optional[WorkerSignals] = None, **kwargs):
         super().__init__()
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
-        self.signals = WorkerSignals()
+        self._signals = signals
         self.cancel_requested = False
 
+    @property
+    def signals(self) -> WorkerSignals:
+        if self._signals is None:
+            self._signals = WorkerSignals()
+        return self._signals
+
     def cancel(self):
         self.cancel_requested = True
 
     def run(self):
+        signals = self._signals
         try:
             result = self.fn(self, *self.args, **self.kwargs)
-            self.signals.result.emit(result)
+            if signals is not None:
+                signals.result.emit(result)
         except Exception as exc:
             logger.exception("Async worker failed")
-            self.signals.error.emit("İşlem başarısız", str(exc))
+            if signals is not None:
+                signals.error.emit("İşlem başarısız", str(exc))
         finally:
-            self.signals.finished.emit()
+            if signals is not None:
+                signals.finished.emit()
+
+
+class BatchWorkerRunnable(WorkerRunnable):
+    """
+    Run many small callables in one QRunnable with a single WorkerSignals.
+
+    Each callable receives the runnable as its first argument. Progress is
+    emitted after every job and ``result`` carries the list of all results.
+    """
+
+    def __init__(self, fns: Sequence[Callable], label: str = "", signals: Optional[WorkerSignals] = None):
+        super().__init__(self._run_batch, signals=signals)
+        self.fns = list(fns)
+        self.label = label
+
+    def _run_batch(self, worker) -> List[Any]:
+        results: List[Any] = []
+        total = len(self.fns)
+        signals = self._signals
+        for i, fn in enumerate(self.fns, 1):
+            if self.cancel_requested:
+                break
+            results.append(fn(self))
+            if signals is not None:
+                signals.progress.emit(self.label, int(i * 100 / total))
+        return results
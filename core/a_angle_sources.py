@@ -1,35 +1,36 @@
-import math
 from typing import Iterable, Sequence, Tuple
 
 import numpy as np
 
+# Angles live in [-180, 180] (or a few turns once unwrapped), far inside
+# float32 precision; coordinates and differences stay float64.
+ANGLE_DTYPE = np.float32
+
 
 def compute_a_from_2d_tangent(points_xyz: Sequence[Sequence[float]]) -> np.ndarray:
     pts = np.asarray(points_xyz, dtype=np.float64)
     if pts.ndim != 2 or pts.shape[0] == 0:
-        return np.zeros((0,), dtype=np.float64)
+        return np.zeros((0,), dtype=ANGLE_DTYPE)
     if pts.shape[1] < 2:
-        return np.zeros((pts.shape[0],), dtype=np.float64)
+        return np.zeros((pts.shape[0],), dtype=ANGLE_DTYPE)
     xy = pts[:, :2]
     n = xy.shape[0]
-    angles = np.zeros((n,), dtype=np.float64)
-    for i in range(n):
-        if n < 2:
-            angles[i] = 0.0
-            continue
-        if i == 0:
-            v = xy[1] - xy[0]
-        elif i == n - 1:
-            v = xy[-1] - xy[-2]
-        else:
-            v = xy[i + 1] - xy[i - 1]
-        vx = float(v[0])
-        vy = float(v[1])
-        if abs(vx) < 1e-9 and abs(vy) < 1e-9:
-            angles[i] = angles[i - 1] if i > 0 else 0.0
-        else:
-            ang = math.degrees(math.atan2(vy, vx))
-            angles[i] = ((ang + 180.0) % 360.0) - 180.0
+    if n < 2:
+        return np.zeros((n,), dtype=ANGLE_DTYPE)
+    dx = np.gradient(xy[:, 0])
+    dy = np.gradient(xy[:, 1])
+    angles = np.degrees(np.arctan2(dy.astype(ANGLE_DTYPE), dx.astype(ANGLE_DTYPE)))
+    angles = ((angles + 180.0) % 360.0) - 180.0
+    # np.gradient halves the interior central differences; scale the
+    # tolerance to match so degenerate detection is unchanged.
+    eps = np.full((n,), 0.5e-9)
+    eps[0] = eps[-1] = 1e-9
+    degenerate = (np.abs(dx) < eps) & (np.abs(dy) < eps)
+    if degenerate.any():
+        # Degenerate tangents repeat the last valid angle (0 before any).
+        src = np.where(degenerate, -1, np.arange(n))
+        np.maximum.accumulate(src, out=src)
+        angles = np.where(src >= 0, angles[np.maximum(src, 0)], 0.0)
     return angles
 
 
@@ -39,22 +40,25 @@ def compute_a_from_mesh_normal(mesh, points_xyz: Sequence[Sequence[float]]) -> n
     return compute_a_from_2d_tangent(points_xyz)
 
 
+def _as_float_array(values: Iterable[float]) -> np.ndarray:
+    if isinstance(values, (np.ndarray, list, tuple)):
+        return np.asarray(values, dtype=ANGLE_DTYPE)
+    return np.fromiter(values, dtype=ANGLE_DTYPE)
+
+
 def unwrap_angles_deg(angles_deg: Iterable[float]) -> np.ndarray:
-    angles = np.asarray(list(angles_deg), dtype=np.float64)
+    angles = _as_float_array(angles_deg)
     if angles.size == 0:
         return angles
     unwrapped = angles.copy()
-    for i in range(1, len(unwrapped)):
-        diff = unwrapped[i] - unwrapped[i - 1]
-        if diff > 180.0:
-            unwrapped[i:] -= 360.0
-        elif diff < -180.0:
-            unwrapped[i:] += 360.0
+    diff = np.diff(angles)
+    steps = np.where(diff > 180.0, -360.0, np.where(diff < -180.0, 360.0, 0.0)).astype(ANGLE_DTYPE)
+    unwrapped[1:] += np.cumsum(steps)
     return unwrapped
 
 
 def smooth_angles_deg(angles_deg: Iterable[float], window: int) -> np.ndarray:
-    angles = np.asarray(list(angles_deg), dtype=np.float64)
+    angles = _as_float_array(angles_deg)
     if angles.size == 0:
         return angles
     window = int(window)
@@ -62,12 +66,13 @@ def smooth_angles_deg(angles_deg: Iterable[float], window: int) -> np.ndarray:
         return angles.copy()
     pad = window // 2
     padded = np.pad(angles, (pad, pad), mode="edge")
-    kernel = np.ones(window, dtype=np.float64) / float(window)
+    kernel = np.full(window, 1.0 / window, dtype=ANGLE_DTYPE)
     return np.convolve(padded, kernel, mode="valid")
 
 
 def compute_a_angles(mesh, points_xyz: Sequence[Sequence[float]], mode: str) -> Tuple[np.ndarray, dict]:
     meta = {}
+    pts = np.asarray(points_xyz, dtype=np.float64)
     mode_norm = str(mode or "2d_tangent").strip().lower()
     if mode_norm not in ("2d_tangent", "mesh_normal", "hybrid"):
         meta["fallback"] = "2d_tangent"
@@ -77,20 +82,18 @@ def compute_a_angles(mesh, points_xyz: Sequence[Sequence[float]], mode: str) ->
         if mesh is None:
             meta["fallback"] = "2d_tangent"
             meta["reason"] = "mesh_missing"
-            angles = compute_a_from_2d_tangent(points_xyz)
+            angles = compute_a_from_2d_tangent(pts)
         else:
-            angles = compute_a_from_mesh_normal(mesh, points_xyz)
+            angles = compute_a_from_mesh_normal(mesh, pts)
             meta["fallback"] = "2d_tangent"
             meta["reason"] = "mesh_normal_not_implemented"
     else:
-        angles = compute_a_from_2d_tangent(points_xyz)
+        angles = compute_a_from_2d_tangent(pts)
         if mode_norm == "hybrid":
             meta["mode"] = "hybrid"
-    pts = np.asarray(points_xyz, dtype=np.float64)
-    if pts.ndim != 2:
-        pts = np.zeros((0, 2), dtype=np.float64)
-    if angles.size != pts.shape[0]:
+    n_pts = pts.shape[0] if pts.ndim == 2 else 0
+    if angles.size != n_pts:
         meta["fallback"] = "2d_tangent"
         meta["reason"] = "length_mismatch"
-        angles = compute_a_from_2d_tangent(points_xyz)
-    return angles.astype(np.float32, copy=False), meta
+        angles = compute_a_from_2d_tangent(pts)
+    return angles.astype(ANGLE_DTYPE, copy=False), meta
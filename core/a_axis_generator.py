@@ -1,7 +1,10 @@
 import logging
 import math
 import time
-from typing import Iterable, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from project_state import ToolpathPoint
 from core.knife_orientation import axis_from_direction
@@ -9,62 +12,85 @@ from core.knife_orientation import axis_from_direction
 logger = logging.getLogger(__name__)
 
 
-def _extract_xy(points: Iterable[ToolpathPoint]) -> List[Tuple[float, float]]:
-    return [(float(p.x), float(p.y)) for p in points]
+@dataclass
+class ToolpathSoA:
+    """Column (structure-of-arrays) view of a ToolpathPoint sequence."""
 
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    a: Optional[np.ndarray] = None
 
-def _angle_delta_deg(a0: float, a1: float) -> float:
-    return (a1 - a0 + 180.0) % 360.0 - 180.0
+    @classmethod
+    def from_points(cls, points: Sequence[ToolpathPoint]) -> "ToolpathSoA":
+        n = len(points)
+        return cls(
+            x=np.fromiter((p.x for p in points), dtype=np.float64, count=n),
+            y=np.fromiter((p.y for p in points), dtype=np.float64, count=n),
+            z=np.fromiter((p.z for p in points), dtype=np.float64, count=n),
+        )
 
+    def __len__(self) -> int:
+        return int(self.x.shape[0])
 
-def _unwrap_deg(angles_deg: Sequence[float]) -> List[float]:
-    if not angles_deg:
-        return []
-    unwrapped = [float(angles_deg[0])]
-    for ang in angles_deg[1:]:
-        prev = unwrapped[-1]
-        delta = _angle_delta_deg(prev, float(ang))
-        unwrapped.append(prev + delta)
+    def take(self, idx: np.ndarray) -> "ToolpathSoA":
+        return ToolpathSoA(
+            self.x[idx],
+            self.y[idx],
+            self.z[idx],
+            None if self.a is None else self.a[idx],
+        )
+
+    def to_points(self) -> List[ToolpathPoint]:
+        a_vals = self.a.tolist() if self.a is not None else [None] * len(self)
+        return [
+            ToolpathPoint(x, y, z, a)
+            for x, y, z, a in zip(self.x.tolist(), self.y.tolist(), self.z.tolist(), a_vals)
+        ]
+
+
+def _xy_array(points: Sequence[ToolpathPoint]) -> np.ndarray:
+    return np.fromiter(
+        ((p.x, p.y) for p in points),
+        dtype=np.dtype((np.float64, 2)),
+        count=len(points),
+    )
+
+
+def _wrap_deg(angles_deg: np.ndarray) -> np.ndarray:
+    return (angles_deg + 180.0) % 360.0 - 180.0
+
+
+def _unwrap_deg(angles_deg: np.ndarray) -> np.ndarray:
+    angles = np.asarray(angles_deg, dtype=np.float64)
+    if angles.size == 0:
+        return angles
+    unwrapped = np.empty_like(angles)
+    unwrapped[0] = angles[0]
+    np.cumsum(_wrap_deg(np.diff(angles)), out=unwrapped[1:])
+    unwrapped[1:] += angles[0]
     return unwrapped
 
 
-def _circular_smooth_deg(angles_deg: Sequence[float], window: int) -> List[float]:
-    if not angles_deg:
-        return []
+def _circular_smooth_deg(angles_deg: np.ndarray, window: int) -> np.ndarray:
+    angles = np.asarray(angles_deg, dtype=np.float64)
     window = int(window)
-    if window <= 1:
-        return [float(a) for a in angles_deg]
+    if angles.size == 0 or window <= 1:
+        return angles
     half = window // 2
-    out: List[float] = []
-    for i in range(len(angles_deg)):
-        start = max(0, i - half)
-        end = min(len(angles_deg), i + half + 1)
-        sin_sum = 0.0
-        cos_sum = 0.0
-        count = 0
-        for j in range(start, end):
-            ang = math.radians(float(angles_deg[j]))
-            sin_sum += math.sin(ang)
-            cos_sum += math.cos(ang)
-            count += 1
-        if count <= 0:
-            out.append(float(angles_deg[i]))
-        else:
-            out.append(math.degrees(math.atan2(sin_sum / count, cos_sum / count)))
-    return out
-
-
-def _compute_segment_angles_deg(points_xy: Sequence[Tuple[float, float]]) -> List[float]:
-    if len(points_xy) < 2:
-        return []
-    angles: List[float] = []
-    for i in range(len(points_xy) - 1):
-        x0, y0 = points_xy[i]
-        x1, y1 = points_xy[i + 1]
-        dx = x1 - x0
-        dy = y1 - y0
-        angles.append(math.degrees(math.atan2(dy, dx)))
-    return angles
+    rad = np.deg2rad(angles)
+    # Zero padding truncates the window at the ends; the mean's 1/count
+    # factor cancels inside atan2, so plain window sums are enough.
+    kernel = np.ones(2 * half + 1, dtype=np.float64)
+    sin_sum = np.convolve(np.pad(np.sin(rad), (half, half)), kernel, mode="valid")
+    cos_sum = np.convolve(np.pad(np.cos(rad), (half, half)), kernel, mode="valid")
+    return np.degrees(np.arctan2(sin_sum, cos_sum))
+
+
+def _compute_segment_angles_deg(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    if len(x) < 2:
+        return np.zeros((0,), dtype=np.float64)
+    return np.degrees(np.arctan2(np.diff(y), np.diff(x)))
 
 
 def _detect_corners(angles_seg_deg: Sequence[float], threshold_deg: float) -> List[int]:
@@ -73,12 +99,8 @@ def _detect_corners(angles_seg_deg: Sequence[float], threshold_deg: float) -> Li
     threshold = float(threshold_deg)
     if threshold <= 0.0:
         return []
-    corners: List[int] = []
-    for i in range(1, len(angles_seg_deg)):
-        delta = abs(_angle_delta_deg(float(angles_seg_deg[i - 1]), float(angles_seg_deg[i])))
-        if delta >= threshold:
-            corners.append(i)
-    return corners
+    d = _wrap_deg(np.diff(np.asarray(angles_seg_deg, dtype=np.float64)))
+    return (np.flatnonzero(np.abs(d) >= threshold) + 1).tolist()
 
 
 def _apply_mount_offset_deg(direction: str, reverse: bool, extra_offset_deg: float) -> float:
@@ -107,36 +129,45 @@ def generate_a_overlay(
     """
     t0 = time.perf_counter()
     points_list = list(points)
-    points_xy = _extract_xy(points_list)
-    if len(points_xy) < 2:
+    if len(points_list) < 2:
         return list(points_list), {"angles_deg": [], "corners": []}
+    soa = ToolpathSoA.from_points(points_list)
 
-    angles_seg_raw = _compute_segment_angles_deg(points_xy)
+    angles_seg_raw = _compute_segment_angles_deg(soa.x, soa.y)
     angles_seg_smoothed = _circular_smooth_deg(angles_seg_raw, smooth_window)
     angles_seg_unwrapped = _unwrap_deg(angles_seg_smoothed)
-    angles_point = angles_seg_unwrapped + [angles_seg_unwrapped[-1]]
+    angles_point = np.append(angles_seg_unwrapped, angles_seg_unwrapped[-1])
 
     mount_offset = _apply_mount_offset_deg(knife_direction, a_reverse, a_offset_deg)
-    angles_point = [a + mount_offset for a in angles_point]
+    angles_point = angles_point + mount_offset
 
     corner_indices = _detect_corners(angles_seg_raw, corner_threshold_deg)
-    new_points: List[ToolpathPoint] = []
-    new_angles: List[float] = []
-
-    prev_angle = angles_point[0]
-    for i, pt in enumerate(points_list):
-        cur_angle = angles_point[i]
-        if pivot_enable and i in corner_indices:
-            diff = cur_angle - prev_angle
-            if abs(diff) > 1e-6 and pivot_steps > 0:
-                for step in range(1, int(pivot_steps) + 1):
-                    t = step / float(int(pivot_steps) + 1)
-                    ang = prev_angle + diff * t
-                    new_points.append(ToolpathPoint(pt.x, pt.y, pt.z, ang))
-                    new_angles.append(ang)
-        new_points.append(ToolpathPoint(pt.x, pt.y, pt.z, cur_angle))
-        new_angles.append(cur_angle)
-        prev_angle = cur_angle
+    n = len(soa)
+    src = np.arange(n)
+    new_angles_arr = angles_point
+    steps = int(pivot_steps)
+    if pivot_enable and steps > 0 and corner_indices:
+        corners = np.asarray(corner_indices, dtype=np.intp)
+        prev = angles_point[corners - 1]
+        diffs = angles_point[corners] - prev
+        keep = np.abs(diffs) > 1e-6
+        corners = corners[keep]
+        if corners.size:
+            t = np.arange(1, steps + 1, dtype=np.float64) / float(steps + 1)
+            pivot_angles = prev[keep, None] + diffs[keep, None] * t[None, :]
+            # Each pivot corner expands into `steps` pivot rows followed by the corner itself.
+            counts = np.ones(n, dtype=np.intp)
+            counts[corners] += steps
+            src = np.repeat(src, counts)
+            new_angles_arr = angles_point[src]
+            block_start = np.cumsum(counts) - counts
+            pivot_rows = block_start[corners, None] + np.arange(steps)[None, :]
+            new_angles_arr[pivot_rows] = pivot_angles
+
+    out = soa.take(src)
+    out.a = new_angles_arr
+    new_points = out.to_points()
+    new_angles = new_angles_arr.tolist()
 
     elapsed_ms = (time.perf_counter() - t0) * 1000.0
     if len(points_list) >= 10000:
@@ -151,8 +182,8 @@ def generate_a_overlay(
         "pivot_steps": int(pivot_steps),
         "mount_offset_deg": float(mount_offset),
         "point_count": len(new_points),
-        "min_a_deg": float(min(new_angles)) if new_angles else 0.0,
-        "max_a_deg": float(max(new_angles)) if new_angles else 0.0,
+        "min_a_deg": float(new_angles_arr.min()) if new_angles_arr.size else 0.0,
+        "max_a_deg": float(new_angles_arr.max()) if new_angles_arr.size else 0.0,
         "elapsed_ms": float(elapsed_ms),
     }
     return new_points, meta
@@ -165,11 +196,34 @@ def _is_number(val) -> bool:
         return False
 
 
-def _extract_a_path(a_path2d) -> Tuple[List[Tuple[float, float]], List[float]]:
+def _numeric_array(values) -> Optional[np.ndarray]:
+    try:
+        arr = np.asarray(values)
+    except Exception:
+        return None
+    if arr.dtype.kind not in "biuf":
+        return None
+    return arr.astype(np.float64, copy=False)
+
+
+def _fast_xy_and_angles(raw_xy, raw_ang) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    xy = _numeric_array(raw_xy)
+    ang = _numeric_array(raw_ang)
+    if xy is None or ang is None:
+        return None
+    if xy.size == 0:
+        xy = xy.reshape(0, 2)
+    if xy.ndim != 2 or xy.shape[1] < 2 or ang.ndim != 1:
+        return None
+    return xy[:, :2], ang[np.isfinite(ang)]
+
+
+def _extract_a_path(a_path2d) -> Tuple[np.ndarray, np.ndarray]:
     if not a_path2d:
-        return [], []
+        return np.zeros((0, 2), dtype=np.float64), np.zeros((0,), dtype=np.float64)
     points_xy: List[Tuple[float, float]] = []
     angles: List[float] = []
+    raw_xy = raw_ang = None
     if isinstance(a_path2d, dict):
         raw_xy = a_path2d.get("points_xy") or []
         raw_ang = (
@@ -178,6 +232,17 @@ def _extract_a_path(a_path2d) -> Tuple[List[Tuple[float, float]], List[float]]:
             or a_path2d.get("a")
             or []
         )
+    elif (
+        isinstance(a_path2d, (list, tuple))
+        and len(a_path2d) == 2
+        and isinstance(a_path2d[0], (list, tuple))
+        and isinstance(a_path2d[1], (list, tuple))
+    ):
+        raw_xy, raw_ang = a_path2d
+    if raw_xy is not None:
+        fast = _fast_xy_and_angles(raw_xy, raw_ang)
+        if fast is not None:
+            return fast
         for pt in raw_xy:
             try:
                 points_xy.append((float(pt[0]), float(pt[1])))
@@ -186,22 +251,17 @@ def _extract_a_path(a_path2d) -> Tuple[List[Tuple[float, float]], List[float]]:
         for ang in raw_ang:
             if _is_number(ang):
                 angles.append(float(ang))
-        return points_xy, angles
-    if isinstance(a_path2d, (list, tuple)):
-        if (
-            len(a_path2d) == 2
-            and isinstance(a_path2d[0], (list, tuple))
-            and isinstance(a_path2d[1], (list, tuple))
-        ):
-            for pt in a_path2d[0]:
-                try:
-                    points_xy.append((float(pt[0]), float(pt[1])))
-                except Exception:
-                    continue
-            for ang in a_path2d[1]:
-                if _is_number(ang):
-                    angles.append(float(ang))
-            return points_xy, angles
+    elif isinstance(a_path2d, (list, tuple)):
+        try:
+            xya = np.fromiter(
+                ((pt.x, pt.y, pt.a) for pt in a_path2d),
+                dtype=np.dtype((np.float64, 3)),
+                count=len(a_path2d),
+            )
+            xya = xya[np.isfinite(xya[:, 2])]
+            return xya[:, :2], xya[:, 2]
+        except (AttributeError, TypeError, ValueError):
+            pass
         for pt in a_path2d:
             try:
                 if hasattr(pt, "x"):
@@ -217,10 +277,17 @@ def _extract_a_path(a_path2d) -> Tuple[List[Tuple[float, float]], List[float]]:
                     angles.append(float(a_val))
             except Exception:
                 continue
-    return points_xy, angles
+    return (
+        np.asarray(points_xy, dtype=np.float64).reshape(-1, 2),
+        np.asarray(angles, dtype=np.float64),
+    )
 
 
-def _extract_xy_from_points(points: Sequence) -> List[Tuple[float, float]]:
+def _extract_xy_from_points(points: Sequence) -> np.ndarray:
+    try:
+        return _xy_array(points)
+    except (AttributeError, TypeError, ValueError):
+        pass
     points_xy: List[Tuple[float, float]] = []
     for pt in points:
         try:
@@ -236,55 +303,38 @@ def _extract_xy_from_points(points: Sequence) -> List[Tuple[float, float]]:
             points_xy.append((x, y))
         except Exception:
             continue
-    return points_xy
+    return np.asarray(points_xy, dtype=np.float64).reshape(-1, 2)
 
 
-def _cumulative_lengths_xy(points_xy: Sequence[Tuple[float, float]]) -> List[float]:
-    if not points_xy:
-        return []
-    s = [0.0]
-    for i in range(1, len(points_xy)):
-        x0, y0 = points_xy[i - 1]
-        x1, y1 = points_xy[i]
-        s.append(s[-1] + math.hypot(x1 - x0, y1 - y0))
-    return s
+def _cumulative_lengths_xy(points_xy: Sequence[Tuple[float, float]]) -> np.ndarray:
+    pts = np.asarray(points_xy, dtype=np.float64).reshape(-1, 2)
+    if pts.shape[0] == 0:
+        return np.zeros((0,), dtype=np.float64)
+    d = np.diff(pts, axis=0)
+    return np.concatenate(([0.0], np.cumsum(np.hypot(d[:, 0], d[:, 1]))))
 
 
 def _interp_by_s(
     s_src: Sequence[float],
     v_src: Sequence[float],
     s_query: Sequence[float],
-) -> List[float]:
-    if not s_src or not v_src or not s_query:
-        return []
-    if len(s_src) != len(v_src):
-        n = min(len(s_src), len(v_src))
-        s_src = s_src[:n]
-        v_src = v_src[:n]
-    out: List[float] = []
-    if not s_src:
-        return out
-    max_s = s_src[-1]
-    idx = 0
-    for s in s_query:
-        if s <= s_src[0]:
-            out.append(float(v_src[0]))
-            continue
-        if s >= max_s:
-            out.append(float(v_src[-1]))
-            continue
-        while idx < len(s_src) - 2 and s_src[idx + 1] < s:
-            idx += 1
-        s0 = s_src[idx]
-        s1 = s_src[idx + 1]
-        v0 = v_src[idx]
-        v1 = v_src[idx + 1]
-        if abs(s1 - s0) < 1e-9:
-            out.append(float(v0))
-        else:
-            t = (s - s0) / (s1 - s0)
-            out.append(float(v0 + (v1 - v0) * t))
-    return out
+) -> np.ndarray:
+    if len(s_src) == 0 or len(v_src) == 0 or len(s_query) == 0:
+        return np.zeros((0,), dtype=np.float64)
+    n = min(len(s_src), len(v_src))
+    s_arr = np.asarray(s_src, dtype=np.float64)[:n]
+    v_arr = np.asarray(v_src, dtype=np.float64)[:n]
+    q = np.asarray(s_query, dtype=np.float64)
+    if n < 2:
+        return np.full(q.shape, v_arr[0])
+    idx = np.clip(np.searchsorted(s_arr, q, side="left") - 1, 0, n - 2)
+    s0 = s_arr[idx]
+    v0 = v_arr[idx]
+    ds = s_arr[idx + 1] - s0
+    degenerate = np.abs(ds) < 1e-9
+    t = (q - s0) / np.where(degenerate, 1.0, ds)
+    out = np.where(degenerate, v0, v0 + (v_arr[idx + 1] - v0) * t)
+    return np.where(q <= s_arr[0], v_arr[0], np.where(q >= s_arr[-1], v_arr[-1], out))
 
 
 def _clone_point_with_a(pt, a_val: Optional[float]):
@@ -325,7 +375,7 @@ def attach_a_to_3d_points(
         "n3d": len(pts3d),
         "n2d": len(points_xy),
     }
-    if not pts3d or not points_xy or not angles:
+    if not pts3d or len(points_xy) == 0 or len(angles) == 0:
         return (pts3d, meta) if return_meta else pts3d
     if method not in ("arc_length", "arc-length"):
         meta["error"] = f"Unsupported method: {method}"
@@ -336,17 +386,17 @@ def attach_a_to_3d_points(
 
     s2d = _cumulative_lengths_xy(points_xy)
     s3d = _cumulative_lengths_xy(_extract_xy_from_points(pts3d))
-    mapped_a = _interp_by_s(s2d, angles, s3d)
-    out = [_clone_point_with_a(p, a) for p, a in zip(pts3d, mapped_a)]
+    mapped_arr = _interp_by_s(s2d, angles, s3d)
+    out = [_clone_point_with_a(p, a) for p, a in zip(pts3d, mapped_arr.tolist())]
 
-    if mapped_a:
+    if mapped_arr.size:
         meta.update(
             {
                 "ok": True,
-                "s2d_max": float(s2d[-1]) if s2d else 0.0,
-                "s3d_max": float(s3d[-1]) if s3d else 0.0,
-                "min_a": float(min(mapped_a)),
-                "max_a": float(max(mapped_a)),
+                "s2d_max": float(s2d[-1]) if s2d.size else 0.0,
+                "s3d_max": float(s3d[-1]) if s3d.size else 0.0,
+                "min_a": float(mapped_arr.min()),
+                "max_a": float(mapped_arr.max()),
             }
         )
     return (out, meta) if return_meta else out
@@ -2,28 +2,27 @@ from typing import List, Sequence
 
 import numpy as np
 
+from core.a_angle_sources import ANGLE_DTYPE
+
 
 def compute_tangent_angles_deg(points_xy: np.ndarray) -> np.ndarray:
     pts = _ensure_xy(points_xy)
     if pts.shape[0] < 2:
-        return np.zeros((0,), dtype=np.float64)
-    diffs = np.diff(pts, axis=0)
+        return np.zeros((0,), dtype=ANGLE_DTYPE)
+    diffs = np.diff(pts, axis=0).astype(ANGLE_DTYPE)
     angles = np.degrees(np.arctan2(diffs[:, 1], diffs[:, 0]))
-    if angles.size == 0:
-        return angles.astype(np.float64)
-    angles = np.concatenate([angles, angles[-1:]])
-    return angles.astype(np.float64, copy=False)
+    return np.concatenate([angles, angles[-1:]])
 
 
 def unwrap_deg(angles_deg: np.ndarray) -> np.ndarray:
-    angles = np.asarray(angles_deg, dtype=np.float64).reshape(-1)
+    angles = np.asarray(angles_deg, dtype=ANGLE_DTYPE).reshape(-1)
     if angles.size == 0:
         return angles
     return np.rad2deg(np.unwrap(np.deg2rad(angles)))
 
 
 def rewrap_deg(angles_deg: np.ndarray, mode: str = "signed") -> np.ndarray:
-    angles = np.asarray(angles_deg, dtype=np.float64).reshape(-1)
+    angles = np.asarray(angles_deg, dtype=ANGLE_DTYPE).reshape(-1)
     if angles.size == 0:
         return angles
     if mode == "unsigned":
@@ -32,7 +31,7 @@ def rewrap_deg(angles_deg: np.ndarray, mode: str = "signed") -> np.ndarray:
 
 
 def smooth_angles_deg(angles_unwrapped: np.ndarray, window: int) -> np.ndarray:
-    angles = np.asarray(angles_unwrapped, dtype=np.float64).reshape(-1)
+    angles = np.asarray(angles_unwrapped, dtype=ANGLE_DTYPE).reshape(-1)
     if angles.size == 0:
         return angles
     window = int(window)
@@ -40,9 +39,11 @@ def smooth_angles_deg(angles_unwrapped: np.ndarray, window: int) -> np.ndarray:
         return angles.copy()
     pad = window // 2
     padded = np.pad(angles, (pad, pad), mode="edge")
-    kernel = np.ones(window, dtype=np.float64) / float(window)
-    smoothed = np.convolve(padded, kernel, mode="valid")
-    return smoothed
+    # Rolling sum via cumsum keeps the moving average O(N) for any window;
+    # the running sum is accumulated in float64 to avoid drift.
+    csum = np.concatenate(([0.0], np.cumsum(padded, dtype=np.float64)))
+    smoothed = (csum[window:] - csum[:-window]) / float(window)
+    return smoothed.astype(ANGLE_DTYPE)
 
 
 def detect_corners(
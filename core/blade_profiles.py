@@ -1,6 +1,10 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any
-import math
+
+import numpy as np
+
+from core.profile_names import canonical_profile
 
 Point2D = Tuple[float, float]
 
@@ -44,33 +48,22 @@ def _get(params: Dict[str, float], key: str, default: float) -> float:
 def _arc_points(cx: float, cy: float, r: float, start_deg: float, end_deg: float, steps: int) -> List[Point2D]:
     if steps < 2:
         steps = 2
-    pts = []
-    for i in range(steps):
-        t = i / (steps - 1)
-        ang = math.radians(start_deg + (end_deg - start_deg) * t)
-        pts.append((cx + r * math.cos(ang), cy + r * math.sin(ang)))
-    return pts
+    ang = np.deg2rad(np.linspace(start_deg, end_deg, steps))
+    return list(zip((cx + r * np.cos(ang)).tolist(), (cy + r * np.sin(ang)).tolist()))
 
 
 def _circle_points(cx: float, cy: float, r: float, steps: int) -> List[Point2D]:
-    pts = []
-    for i in range(steps):
-        ang = (2.0 * math.pi) * (i / steps)
-        pts.append((cx + r * math.cos(ang), cy + r * math.sin(ang)))
-    if pts:
-        pts.append(pts[0])
+    if steps <= 0:
+        return []
+    ang = np.linspace(0.0, 2.0 * np.pi, steps, endpoint=False)
+    pts = list(zip((cx + r * np.cos(ang)).tolist(), (cy + r * np.sin(ang)).tolist()))
+    pts.append(pts[0])
     return pts
 
 
+@lru_cache(maxsize=64)
 def _normalize_profile_name(name: str) -> str:
-    n = (name or "").strip().lower().replace("-", "_").replace(" ", "")
-    if n in ("scalpel", "scalpelpointed", "scalpel_pointed", "pointed"):
-        return "scalpel_pointed"
-    if n in ("scalpelrounded", "scalpel_rounded", "rounded"):
-        return "scalpel_rounded"
-    if n in ("rotarydisk", "rotary_disk", "disk", "rotary"):
-        return "rotary_disk"
-    return n or "scalpel_pointed"
+    return canonical_profile(name)
 
 
 def _build_scalpel_pointed(params: Dict[str, float]) -> Dict[str, Any]:
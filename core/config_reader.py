@@ -1,5 +1,6 @@
 import configparser
-from typing import Any, Callable, List, Optional, Set
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from core.result import WarningItem
 
@@ -15,6 +16,27 @@ def _append_warning(
     warnings_out.append(WarningItem(code=code, message=message, context=context))
 
 
+# Memo of resolved values per ConfigParser, keyed by id(); ConfigParser is an
+# unhashable mapping, so entries are dropped by a finalizer when it dies.
+_VALUE_CACHE: Dict[int, Dict[tuple, Any]] = {}
+
+
+def invalidate_cfg_cache(cfg: configparser.ConfigParser) -> None:
+    """Drop memoized values for ``cfg`` after it was modified in place."""
+    cache = _VALUE_CACHE.get(id(cfg))
+    if cache is not None:
+        cache.clear()
+
+
+def _cache_for(cfg: configparser.ConfigParser) -> Dict[tuple, Any]:
+    cfg_id = id(cfg)
+    cache = _VALUE_CACHE.get(cfg_id)
+    if cache is None:
+        cache = _VALUE_CACHE[cfg_id] = {}
+        weakref.finalize(cfg, _VALUE_CACHE.pop, cfg_id, None)
+    return cache
+
+
 def get_cfg_value(
     cfg: configparser.ConfigParser,
     section: str,
@@ -23,6 +45,28 @@ def get_cfg_value(
     fallback: Any,
     warnings_out: Optional[List[WarningItem]] = None,
     missing_sections: Optional[Set[str]] = None,
+) -> Any:
+    key = (section, option, getattr(getter, "__func__", getter), fallback)
+    try:
+        cache = _cache_for(cfg)
+        if key in cache:
+            return cache[key]
+    except TypeError:
+        # Unhashable fallback or non-weakrefable parser: resolve uncached.
+        return _resolve_cfg_value(cfg, section, option, getter, fallback, warnings_out, missing_sections)
+    value = _resolve_cfg_value(cfg, section, option, getter, fallback, warnings_out, missing_sections)
+    cache[key] = value
+    return value
+
+
+def _resolve_cfg_value(
+    cfg: configparser.ConfigParser,
+    section: str,
+    option: str,
+    getter: Callable[..., Any],
+    fallback: Any,
+    warnings_out: Optional[List[WarningItem]],
+    missing_sections: Optional[Set[str]],
 ) -> Any:
     if missing_sections is None:
         missing_sections = set()
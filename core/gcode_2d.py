@@ -1,5 +1,7 @@
 from typing import Iterable, Sequence
 
+import numpy as np
+
 
 def build_xya_gcode(
     points_xy: Iterable[Sequence[float]],
@@ -7,8 +9,10 @@ def build_xya_gcode(
     feed_rate: float = 2000.0,
     precision: int = 3,
 ) -> str:
-    pts = list(points_xy or [])
-    angs = list(angles_deg or [])
+    if points_xy is None or angles_deg is None:
+        return ""
+    pts = points_xy if isinstance(points_xy, (list, tuple, np.ndarray)) else list(points_xy)
+    angs = angles_deg if isinstance(angles_deg, (list, tuple, np.ndarray)) else list(angles_deg)
     count = min(len(pts), len(angs))
     if count <= 0:
         return ""
@@ -16,11 +20,13 @@ def build_xya_gcode(
     if precision < 0:
         precision = 0
     fmt = f"{{:.{precision}f}}"
+    # One C-level conversion to Python floats, then one template format per line.
+    if isinstance(pts, np.ndarray):
+        xy = np.asarray(pts[:count, :2], dtype=np.float64).tolist()
+    else:
+        xy = np.asarray([pt[:2] for pt in pts[:count]], dtype=np.float64).tolist()
+    a = np.asarray(angs[:count], dtype=np.float64).tolist()
+    line_fmt = f"G1 X%.{precision}f Y%.{precision}f A%.{precision}f"
     lines = ["G21", "G90", "G17", f"F{fmt.format(float(feed_rate))}"]
-    for i in range(count):
-        pt = pts[i]
-        x = float(pt[0])
-        y = float(pt[1])
-        a = float(angs[i])
-        lines.append(f"G1 X{fmt.format(x)} Y{fmt.format(y)} A{fmt.format(a)}")
+    lines.extend([line_fmt % (x, y, ang) for (x, y), ang in zip(xy, a)])
     return "\n".join(lines)
@@ -3,7 +3,6 @@ from typing import Any
 
 
 def write_json(path: str, data: Any) -> None:
-    text = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True)
     with open(path, "w", encoding="utf-8", newline="\n") as f:
-        f.write(text)
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
         f.write("\n")
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -13,7 +14,16 @@ class KnifeDef:
 
 
 def load_catalog() -> List[KnifeDef]:
-    return [
+    return list(_catalog())
+
+
+def knife_by_id(knife_id: str) -> Optional[KnifeDef]:
+    return _CATALOG_BY_ID.get(knife_id)
+
+
+@lru_cache(maxsize=1)
+def _catalog() -> Tuple[KnifeDef, ...]:
+    return (
         KnifeDef(
             id="TL-052",
             name="Scalpel 30deg",
@@ -94,4 +104,7 @@ def load_catalog() -> List[KnifeDef]:
                 "knife_angle_deg": 0.0,
             },
         ),
-    ]
+    )
+
+
+_CATALOG_BY_ID: Dict[str, KnifeDef] = {k.id: k for k in _catalog()}
@@ -1,169 +1,241 @@
 import math
-from typing import Dict, Tuple, List
+from functools import lru_cache
+from typing import Dict, Tuple
 
 import numpy as np
 
+from core.profile_names import canonical_profile as _normalize_profile
 
-def _normalize_profile(name: str) -> str:
-    n = (name or "").strip().lower().replace("-", "_").replace(" ", "")
-    if n in ("scalpel", "scalpelpointed", "scalpel_pointed", "pointed"):
-        return "scalpel_pointed"
-    if n in ("scalpelrounded", "scalpel_rounded", "rounded"):
-        return "scalpel_rounded"
-    if n in ("rotarydisk", "rotary_disk", "disk", "rotary"):
-        return "rotary_disk"
-    return n or "scalpel_pointed"
 
-
-def _cross(a, b):
-    return (
-        a[1] * b[2] - a[2] * b[1],
-        a[2] * b[0] - a[0] * b[2],
-        a[0] * b[1] - a[1] * b[0],
-    )
-
-
-def _sub(a, b):
-    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
-
-
-def _normalize(v):
-    length = math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
-    if length <= 1e-8:
-        return (0.0, 1.0, 0.0)
-    return (v[0] / length, v[1] / length, v[2] / length)
-
-
-def _add_tri(verts: List[Tuple[float, float, float]], norms: List[Tuple[float, float, float]], v0, v1, v2):
-    n = _normalize(_cross(_sub(v1, v0), _sub(v2, v0)))
-    verts.extend([v0, v1, v2])
-    norms.extend([n, n, n])
-
-
-def _add_quad(verts: List[Tuple[float, float, float]], norms: List[Tuple[float, float, float]], v0, v1, v2, v3):
-    _add_tri(verts, norms, v0, v1, v2)
-    _add_tri(verts, norms, v0, v2, v3)
+# Output column of u and v per mesh axis (y always stays in column 1). The
+# mapping is its own inverse, so the same pair also reads (u, y, v) back.
+_AXIS_COLUMNS: Dict[str, Tuple[int, int]] = {"x": (0, 2), "y": (2, 0)}
+# The "y" mapping mirrors (u, y, v), which flips winding-derived normals.
+_AXIS_WINDING: Dict[str, float] = {"x": 1.0, "y": -1.0}
 
 
 def _map_uvy(u: float, v: float, y: float, axis: str) -> Tuple[float, float, float]:
-    if axis == "y":
-        return (v, y, u)
-    return (u, y, v)
+    uyv = (u, y, v)
+    ui, vi = _AXIS_COLUMNS.get(axis, (0, 2))
+    return (uyv[ui], y, uyv[vi])
+
+
+def _winding_sign(axis: str) -> float:
+    return _AXIS_WINDING.get(axis, 1.0)
+
+
+def _map_uvy_arr(u, v, y, axis: str) -> np.ndarray:
+    ui, vi = _AXIS_COLUMNS.get(axis, (0, 2))
+    out = np.empty(np.broadcast(u, v, y).shape + (3,), dtype=np.float64)
+    out[..., ui] = u
+    out[..., 1] = y
+    out[..., vi] = v
+    return out
+
+
+def _tri_normals(v0: np.ndarray, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+    a = v1 - v0
+    b = v2 - v0
+    n = np.empty_like(a)
+    n[:, 0] = a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1]
+    n[:, 1] = a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2]
+    n[:, 2] = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    length = np.sqrt((n * n).sum(axis=1))
+    flat = length <= 1e-8
+    n /= np.where(flat, 1.0, length)[:, None]
+    n[flat] = (0.0, 1.0, 0.0)
+    return n
+
+
+def _alloc_part(tri_count: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Interleaved x, y, z, nx, ny, nz rows plus the vertex and normal column views.
+    buf = np.empty((tri_count * 3, 6), dtype=np.float32)
+    return buf, buf[:, :3], buf[:, 3:]
+
+
+def mesh_part_arrays(part) -> Tuple[np.ndarray, np.ndarray]:
+    """Split an interleaved mesh part into (verts, norms) views; tuples pass through."""
+    if isinstance(part, (list, tuple)):
+        return part[0], part[1]
+    arr = np.asarray(part, dtype=np.float32).reshape(-1, 6)
+    return arr[:, :3], arr[:, 3:]
+
+
+def _add_quads_n(verts: np.ndarray, norms: np.ndarray, cursor: int, v0, v1, v2, v3, n) -> int:
+    # Per quad: (v0, v1, v2) then (v0, v2, v3), both with face normal n.
+    end = cursor + len(v0) * 6
+    out = verts[cursor:end].reshape(-1, 6, 3)
+    out[:, 0] = v0
+    out[:, 1] = v1
+    out[:, 2] = v2
+    out[:, 3] = v0
+    out[:, 4] = v2
+    out[:, 5] = v3
+    norms[cursor:end].reshape(-1, 6, 3)[:] = n[:, None, :]
+    return end
+
+
+def _add_quads_arr(verts: np.ndarray, norms: np.ndarray, cursor: int, v0, v1, v2, v3) -> int:
+    # Planar quads: one face normal serves both triangles.
+    return _add_quads_n(verts, norms, cursor, v0, v1, v2, v3, _tri_normals(v0, v1, v2))
+
+
+# Unit corner offsets of the prism cross-section, counter-clockwise.
+_PRISM_U = np.array([-1.0, 1.0, 1.0, -1.0])
+_PRISM_V = np.array([-1.0, -1.0, 1.0, 1.0])
+
+# Corner indices (p0..p3 at y0, q0..q3 at y1) of the four sides and two caps.
+_PRISM_QUADS = np.array(
+    [
+        [0, 1, 5, 4],
+        [1, 2, 6, 5],
+        [2, 3, 7, 6],
+        [3, 0, 4, 7],
+        [3, 2, 1, 0],
+        [4, 5, 6, 7],
+    ]
+)
 
 
 def _add_prism(
-    verts: List[Tuple[float, float, float]],
-    norms: List[Tuple[float, float, float]],
+    verts: np.ndarray,
+    norms: np.ndarray,
+    cursor: int,
     width: float,
     thick0: float,
     thick1: float,
     y0: float,
     y1: float,
     axis: str,
-):
+) -> int:
     half_w = width * 0.5
     half_t0 = thick0 * 0.5
     half_t1 = thick1 * 0.5
 
-    p0 = _map_uvy(-half_w, -half_t0, y0, axis)
-    p1 = _map_uvy(half_w, -half_t0, y0, axis)
-    p2 = _map_uvy(half_w, half_t0, y0, axis)
-    p3 = _map_uvy(-half_w, half_t0, y0, axis)
-
-    q0 = _map_uvy(-half_w, -half_t1, y1, axis)
-    q1 = _map_uvy(half_w, -half_t1, y1, axis)
-    q2 = _map_uvy(half_w, half_t1, y1, axis)
-    q3 = _map_uvy(-half_w, half_t1, y1, axis)
-
-    _add_quad(verts, norms, p0, p1, q1, q0)
-    _add_quad(verts, norms, p1, p2, q2, q1)
-    _add_quad(verts, norms, p2, p3, q3, q2)
-    _add_quad(verts, norms, p3, p0, q0, q3)
-
-    _add_quad(verts, norms, p3, p2, p1, p0)
-    _add_quad(verts, norms, q0, q1, q2, q3)
+    u = _PRISM_U * half_w
+    corners = np.concatenate(
+        (
+            _map_uvy_arr(u, _PRISM_V * half_t0, y0, axis),
+            _map_uvy_arr(u, _PRISM_V * half_t1, y1, axis),
+        )
+    )
+    q = corners[_PRISM_QUADS]
+    return _add_quads_arr(verts, norms, cursor, q[:, 0], q[:, 1], q[:, 2], q[:, 3])
+
+
+@lru_cache(maxsize=8)
+def _unit_circle(segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    # segments + 1 samples so consecutive pairs close the ring; shared, keep read-only.
+    ang = np.arange(segments + 1) * ((2.0 * math.pi) / segments)
+    cos_t = np.cos(ang)
+    sin_t = np.sin(ang)
+    cos_t.flags.writeable = False
+    sin_t.flags.writeable = False
+    return cos_t, sin_t
+
+
+def _freeze(arr: np.ndarray) -> np.ndarray:
+    arr.flags.writeable = False
+    return arr
+
+
+@lru_cache(maxsize=16)
+def _cylinder_template(segments: int, axis: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Unit cylinder (radius 1, length 1) triangles and normals for ``axis``."""
+    cos_t, sin_t = _unit_circle(segments)
+    u0, v0, u1, v1 = cos_t[:-1], sin_t[:-1], cos_t[1:], sin_t[1:]
+    p0 = _map_uvy_arr(u0, v0, 0.0, axis)
+    p1 = _map_uvy_arr(u1, v1, 0.0, axis)
+    q1 = _map_uvy_arr(u1, v1, -1.0, axis)
+    q0 = _map_uvy_arr(u0, v0, -1.0, axis)
+    center_top = _map_uvy_arr(np.zeros(segments), 0.0, 0.0, axis)
+    center_bot = _map_uvy_arr(np.zeros(segments), 0.0, -1.0, axis)
+    # Side quads (two tris each), then per segment: top cap tri, bottom cap tri.
+    sides = np.stack((p0, p1, q1, p0, q1, q0), axis=1).reshape(-1, 3)
+    caps = np.stack((center_top, p1, p0, center_bot, q0, q1), axis=1).reshape(-1, 3)
+
+    # Facet normals point through the middle of each segment; caps face +/- y.
+    sign = _winding_sign(axis)
+    mid = sign / (2.0 * math.cos(math.pi / segments))
+    side_n = _map_uvy_arr((u0 + u1) * mid, (v0 + v1) * mid, 0.0, axis)
+    cap_n = np.empty((segments, 2, 3))
+    cap_n[:, 0] = _map_uvy(0.0, 0.0, sign, axis)
+    cap_n[:, 1] = _map_uvy(0.0, 0.0, -sign, axis)
+    norms = np.concatenate((np.repeat(side_n, 6, axis=0), np.repeat(cap_n.reshape(-1, 3), 3, axis=0)))
+    return _freeze(np.concatenate((sides, caps))), _freeze(norms.astype(np.float32))
+
+
+@lru_cache(maxsize=16)
+def _disk_template(segments: int, axis: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Unit disk (radius 1, half thickness 1) triangles and normals for ``axis``."""
+    cos_t, sin_t = _unit_circle(segments)
+    u0, y0, u1, y1 = cos_t[:-1], sin_t[:-1], cos_t[1:], sin_t[1:]
+    f0 = _map_uvy_arr(u0, -1.0, y0, axis)
+    f1 = _map_uvy_arr(u1, -1.0, y1, axis)
+    b1 = _map_uvy_arr(u1, 1.0, y1, axis)
+    b0 = _map_uvy_arr(u0, 1.0, y0, axis)
+    center_front = _map_uvy_arr(np.zeros(segments), -1.0, 0.0, axis)
+    center_back = _map_uvy_arr(np.zeros(segments), 1.0, 0.0, axis)
+    # Per segment: rim quad (2 tris), front cap tri, back cap tri.
+    tris = np.stack(
+        (f0, f1, b1, f0, b1, b0, center_front, f1, f0, center_back, b0, b1), axis=1
+    ).reshape(-1, 3)
+
+    # Rim normals point through the middle of each segment; faces are +/- v.
+    sign = _winding_sign(axis)
+    mid = sign / (2.0 * math.cos(math.pi / segments))
+    tri_n = np.empty((segments, 4, 3))
+    tri_n[:, 0] = _map_uvy_arr((u0 + u1) * mid, 0.0, (y0 + y1) * mid, axis)
+    tri_n[:, 1] = tri_n[:, 0]
+    tri_n[:, 2] = _map_uvy(0.0, -sign, 0.0, axis)
+    tri_n[:, 3] = _map_uvy(0.0, sign, 0.0, axis)
+    norms = np.repeat(tri_n.reshape(-1, 3), 3, axis=0)
+    return _freeze(tris), _freeze(norms.astype(np.float32))
 
 
 def _add_cylinder(
-    verts: List[Tuple[float, float, float]],
-    norms: List[Tuple[float, float, float]],
+    verts: np.ndarray,
+    norms: np.ndarray,
+    cursor: int,
     radius: float,
     length: float,
     axis: str,
     segments: int = 20,
-):
+) -> int:
     if radius <= 0.0 or length <= 0.0:
-        return
-    y0 = 0.0
-    y1 = -length
-    step = (2.0 * math.pi) / segments
-    for i in range(segments):
-        a0 = i * step
-        a1 = (i + 1) * step
-        u0 = radius * math.cos(a0)
-        v0 = radius * math.sin(a0)
-        u1 = radius * math.cos(a1)
-        v1 = radius * math.sin(a1)
-        p0 = _map_uvy(u0, v0, y0, axis)
-        p1 = _map_uvy(u1, v1, y0, axis)
-        p2 = _map_uvy(u1, v1, y1, axis)
-        p3 = _map_uvy(u0, v0, y1, axis)
-        _add_quad(verts, norms, p0, p1, p2, p3)
-
-    center_top = _map_uvy(0.0, 0.0, y0, axis)
-    center_bot = _map_uvy(0.0, 0.0, y1, axis)
-    for i in range(segments):
-        a0 = i * step
-        a1 = (i + 1) * step
-        u0 = radius * math.cos(a0)
-        v0 = radius * math.sin(a0)
-        u1 = radius * math.cos(a1)
-        v1 = radius * math.sin(a1)
-        p0 = _map_uvy(u0, v0, y0, axis)
-        p1 = _map_uvy(u1, v1, y0, axis)
-        _add_tri(verts, norms, center_top, p1, p0)
-        q0 = _map_uvy(u0, v0, y1, axis)
-        q1 = _map_uvy(u1, v1, y1, axis)
-        _add_tri(verts, norms, center_bot, q0, q1)
+        return cursor
+    unit_v, unit_n = _cylinder_template(segments, axis)
+    end = cursor + len(unit_v)
+    np.multiply(unit_v, _map_uvy(radius, radius, length, axis), out=verts[cursor:end], casting="same_kind")
+    norms[cursor:end] = unit_n
+    return end
 
 
 def _add_disk(
-    verts: List[Tuple[float, float, float]],
-    norms: List[Tuple[float, float, float]],
+    verts: np.ndarray,
+    norms: np.ndarray,
+    cursor: int,
     radius: float,
     thickness: float,
     axis: str,
     segments: int = 32,
-):
+) -> int:
     if radius <= 0.0 or thickness <= 0.0:
-        return
-    half_t = thickness * 0.5
-    step = (2.0 * math.pi) / segments
-    for i in range(segments):
-        a0 = i * step
-        a1 = (i + 1) * step
-        u0 = radius * math.cos(a0)
-        y0 = radius * math.sin(a0)
-        u1 = radius * math.cos(a1)
-        y1 = radius * math.sin(a1)
-
-        p0 = _map_uvy(u0, -half_t, y0, axis)
-        p1 = _map_uvy(u1, -half_t, y1, axis)
-        p2 = _map_uvy(u1, half_t, y1, axis)
-        p3 = _map_uvy(u0, half_t, y0, axis)
-        _add_quad(verts, norms, p0, p1, p2, p3)
-
-        center_front = _map_uvy(0.0, -half_t, 0.0, axis)
-        center_back = _map_uvy(0.0, half_t, 0.0, axis)
-        f0 = _map_uvy(u0, -half_t, y0, axis)
-        f1 = _map_uvy(u1, -half_t, y1, axis)
-        b0 = _map_uvy(u0, half_t, y0, axis)
-        b1 = _map_uvy(u1, half_t, y1, axis)
-        _add_tri(verts, norms, center_front, f1, f0)
-        _add_tri(verts, norms, center_back, b0, b1)
+        return cursor
+    unit_v, unit_n = _disk_template(segments, axis)
+    end = cursor + len(unit_v)
+    np.multiply(unit_v, _map_uvy(radius, thickness * 0.5, radius, axis), out=verts[cursor:end], casting="same_kind")
+    norms[cursor:end] = unit_n
+    return end
 
 
 def build_knife_mesh(profile_name: str, params: Dict[str, float]) -> Dict[str, object]:
+    """Build the knife preview mesh.
+
+    ``body``, ``blade`` and ``kerf`` are (N, 6) float32 triangle vertex arrays
+    laid out as ``x, y, z, nx, ny, nz`` (24-byte stride), ready for a single
+    interleaved upload. Use ``mesh_part_arrays`` for separate views.
+    """
     profile = _normalize_profile(profile_name)
     axis = params.get("direction_axis", "x")
     axis = axis if axis in ("x", "y") else "x"
@@ -183,33 +255,19 @@ def build_knife_mesh(profile_name: str, params: Dict[str, float]) -> Dict[str, o
     edge_thick = max(edge_thick, 0.02)
     body_radius = max(body_diam * 0.5, blade_width * 0.5)
 
-    body_verts: List[Tuple[float, float, float]] = []
-    body_norms: List[Tuple[float, float, float]] = []
-    blade_verts: List[Tuple[float, float, float]] = []
-    blade_norms: List[Tuple[float, float, float]] = []
-    kerf_verts: List[Tuple[float, float, float]] = []
-    kerf_norms: List[Tuple[float, float, float]] = []
-
     if profile == "rotary_disk":
         radius = max(length * 0.5, 0.1)
-        _add_disk(blade_verts, blade_norms, radius, max(disk_thick, 0.1), axis)
+        blade, blade_verts, blade_norms = _alloc_part(4 * 32)
+        blade_n = _add_disk(blade_verts, blade_norms, 0, radius, max(disk_thick, 0.1), axis)
         tip = _map_uvy(0.0, 0.0, -radius, axis)
         return {
-            "body": (np.array(body_verts, dtype=np.float32), np.array(body_norms, dtype=np.float32)),
-            "blade": (np.array(blade_verts, dtype=np.float32), np.array(blade_norms, dtype=np.float32)),
-            "kerf": (np.array(kerf_verts, dtype=np.float32), np.array(kerf_norms, dtype=np.float32)),
+            "body": np.zeros((0, 6), dtype=np.float32),
+            "blade": blade[:blade_n],
+            "kerf": np.zeros((0, 6), dtype=np.float32),
             "tip": tip,
             "length": radius * 2.0,
         }
 
-    if body_len > 0.0:
-        _add_cylinder(body_verts, body_norms, body_radius, body_len, "x", segments=20)
-
-    if body_len > 0.0:
-        _add_prism(blade_verts, blade_norms, blade_width, blade_thick, blade_thick, 0.0, -body_len, axis)
-    if cut_len > 0.0:
-        _add_prism(blade_verts, blade_norms, blade_width, blade_thick, edge_thick, -body_len, -length, axis)
-
     kerf_offset = blade_thick * 0.5
     kerf_width = blade_width
     if cut_len > 0.0:
@@ -218,20 +276,40 @@ def build_knife_mesh(profile_name: str, params: Dict[str, float]) -> Dict[str, o
     else:
         y0 = 0.0
         y1 = -body_len
-    if abs(y1 - y0) > 1e-6:
-        for sign in (-1.0, 1.0):
-            v = sign * kerf_offset
-            a = _map_uvy(-kerf_width * 0.5, v, y0, axis)
-            b = _map_uvy(kerf_width * 0.5, v, y0, axis)
-            c = _map_uvy(kerf_width * 0.5, v, y1, axis)
-            d = _map_uvy(-kerf_width * 0.5, v, y1, axis)
-            _add_quad(kerf_verts, kerf_norms, a, b, c, d)
+    has_kerf = abs(y1 - y0) > 1e-6
+
+    # Size every part up front: 4 tris per cylinder segment, 12 per prism, 2 per kerf quad.
+    body, body_verts, body_norms = _alloc_part(4 * 20 if body_len > 0.0 else 0)
+    blade, blade_verts, blade_norms = _alloc_part(12 * ((body_len > 0.0) + (cut_len > 0.0)))
+    kerf, kerf_verts, kerf_norms = _alloc_part(4 if has_kerf else 0)
+    body_n = blade_n = kerf_n = 0
+
+    if body_len > 0.0:
+        body_n = _add_cylinder(body_verts, body_norms, body_n, body_radius, body_len, "x", segments=20)
+
+    if body_len > 0.0:
+        blade_n = _add_prism(blade_verts, blade_norms, blade_n, blade_width, blade_thick, blade_thick, 0.0, -body_len, axis)
+    if cut_len > 0.0:
+        blade_n = _add_prism(blade_verts, blade_norms, blade_n, blade_width, blade_thick, edge_thick, -body_len, -length, axis)
+
+    if has_kerf:
+        v = np.array([-kerf_offset, kerf_offset])
+        half_kw = kerf_width * 0.5
+        kerf_n = _add_quads_arr(
+            kerf_verts,
+            kerf_norms,
+            kerf_n,
+            _map_uvy_arr(-half_kw, v, y0, axis),
+            _map_uvy_arr(half_kw, v, y0, axis),
+            _map_uvy_arr(half_kw, v, y1, axis),
+            _map_uvy_arr(-half_kw, v, y1, axis),
+        )
 
     tip = _map_uvy(0.0, 0.0, -length, axis)
     return {
-        "body": (np.array(body_verts, dtype=np.float32), np.array(body_norms, dtype=np.float32)),
-        "blade": (np.array(blade_verts, dtype=np.float32), np.array(blade_norms, dtype=np.float32)),
-        "kerf": (np.array(kerf_verts, dtype=np.float32), np.array(kerf_norms, dtype=np.float32)),
+        "body": body[:body_n],
+        "blade": blade[:blade_n],
+        "kerf": kerf[:kerf_n],
         "tip": tip,
         "length": length,
     }
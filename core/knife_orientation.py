@@ -1,6 +1,9 @@
 import math
+from functools import lru_cache
 from typing import Dict, Tuple
 
+from core.profile_names import PROFILE_ALIASES, profile_key
+
 
 def axis_from_direction(direction: str) -> str:
     value = (direction or "").strip().lower()
@@ -26,20 +29,16 @@ def preview_orientation(knife_direction: str, profile_kind: str = "") -> Dict[st
 
 
 def _normalize_profile(profile: str, knife_id: str = "") -> str:
-    value = (profile or "").strip().lower().replace("-", "_").replace(" ", "")
-    if value in ("scalpel", "scalpelpointed", "scalpel_pointed", "pointed"):
-        return "scalpel_pointed"
-    if value in ("scalpelrounded", "scalpel_rounded", "rounded"):
-        return "scalpel_rounded"
-    if value in ("rotarydisk", "rotary_disk", "disk", "rotary", "doner", "döner"):
-        return "rotary_disk"
+    value = profile_key(profile)
+    if value in PROFILE_ALIASES:
+        return PROFILE_ALIASES[value]
     if not value and knife_id:
         try:
-            from core.knife_catalog import load_catalog
+            from core.knife_catalog import knife_by_id
 
-            for knife in load_catalog():
-                if knife.id == knife_id:
-                    return _normalize_profile(knife.kind, "")
+            knife = knife_by_id(knife_id)
+            if knife is not None:
+                return _normalize_profile(knife.kind, "")
         except Exception:
             pass
     return value or "scalpel_pointed"
@@ -94,6 +93,16 @@ def _mat_vec(m, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
     )
 
 
+@lru_cache(maxsize=16)
+def _model_rotation(base_z: float, model_rz: float, model_ry: float, model_rx: float):
+    """Compose the fixed preview rotations once; None when they are all zero."""
+    rot = None
+    for deg, make in ((base_z, _rot_z), (model_rz, _rot_z), (model_ry, _rot_y), (model_rx, _rot_x)):
+        if abs(deg) > 1e-6:
+            rot = make(deg) if rot is None else _mat_mul(rot, make(deg))
+    return rot
+
+
 def compute_tool_pose(
     tool_profile: Dict[str, object],
     x: float,
@@ -107,18 +116,14 @@ def compute_tool_pose(
     )
     orient = preview_orientation(str(tool_profile.get("knife_direction", "")), profile)
     rot = _rot_z(float(a_deg))
-    base_z = float(orient.get("base_rot_z_deg", 0.0))
-    if abs(base_z) > 1e-6:
-        rot = _mat_mul(rot, _rot_z(base_z))
-    model_rz = float(orient.get("model_rz_deg", 0.0))
-    model_ry = float(orient.get("model_ry_deg", 0.0))
-    model_rx = float(orient.get("model_rx_deg", 0.0))
-    if abs(model_rz) > 1e-6:
-        rot = _mat_mul(rot, _rot_z(model_rz))
-    if abs(model_ry) > 1e-6:
-        rot = _mat_mul(rot, _rot_y(model_ry))
-    if abs(model_rx) > 1e-6:
-        rot = _mat_mul(rot, _rot_x(model_rx))
+    model = _model_rotation(
+        float(orient.get("base_rot_z_deg", 0.0)),
+        float(orient.get("model_rz_deg", 0.0)),
+        float(orient.get("model_ry_deg", 0.0)),
+        float(orient.get("model_rx_deg", 0.0)),
+    )
+    if model is not None:
+        rot = _mat_mul(rot, model)
 
     offset_local = (0.0, 0.0, 0.0)
     if profile == "rotary_disk":
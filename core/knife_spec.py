@@ -1,8 +1,10 @@
 import configparser
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 
 from core.path_utils import find_or_create_config
+from core.profile_names import PROFILE_ALIASES, profile_key
 
 INI_PATH = str(find_or_create_config()[0])
 
@@ -16,13 +18,7 @@ def normalize_profile(profile: Optional[str], name: Optional[str] = None) -> str
         if "yuvarlak" in needle or "rounded" in needle:
             return "scalpel_rounded"
         return "scalpel_pointed"
-    if value in ("scalpel", "scalpelpointed", "scalpel_pointed", "pointed"):
-        return "scalpel_pointed"
-    if value in ("scalpelrounded", "scalpel_rounded", "rounded"):
-        return "scalpel_rounded"
-    if value in ("rotarydisk", "rotary_disk", "disk", "rotary", "doner", "d\u00f6ner"):
-        return "rotary_disk"
-    return value
+    return PROFILE_ALIASES.get(profile_key(value), value)
 
 
 def build_knife_spec(
@@ -45,6 +41,16 @@ def build_knife_spec(
 
 
 def load_knife_spec(cfg_path: str = INI_PATH) -> Dict[str, float]:
+    # Parsed specs are cached per file modification time; hand out copies.
+    try:
+        mtime_ns = os.stat(cfg_path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return dict(_load_knife_spec_cached(cfg_path, mtime_ns))
+
+
+@lru_cache(maxsize=4)
+def _load_knife_spec_cached(cfg_path: str, mtime_ns: int) -> Dict[str, float]:
     cfg = configparser.ConfigParser()
     if os.path.exists(cfg_path):
         cfg.read(cfg_path, encoding="utf-8")
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Tuple
+from typing import Hashable, Optional
 
 try:
     import trimesh
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 class MeshIntersectorCache:
     def __init__(self):
-        self._key: Optional[Tuple[object, ...]] = None
+        self._key: Optional[Hashable] = None
         self._intersector = None
         self.build_count = 0
 
@@ -19,16 +19,16 @@ class MeshIntersectorCache:
         self._key = None
         self._intersector = None
 
-    def _make_key(self, mesh, mesh_version: Optional[int]) -> Tuple[object, ...]:
+    def _make_key(self, mesh, mesh_version: Optional[int]) -> Hashable:
+        # A bare int for versioned meshes keeps the hit-path comparison cheap;
+        # unversioned meshes fall back to identity plus vertex/face counts.
         if mesh_version is not None:
-            return ("v", int(mesh_version))
-        try:
-            v_count = int(len(mesh.vertices))
-            f_count = int(len(mesh.faces))
-        except Exception:
-            v_count = 0
-            f_count = 0
-        return ("id", id(mesh), v_count, f_count)
+            return int(mesh_version)
+        vertices = getattr(mesh, "vertices", None)
+        faces = getattr(mesh, "faces", None)
+        v_count = len(vertices) if vertices is not None else 0
+        f_count = len(faces) if faces is not None else 0
+        return (id(mesh), v_count, f_count)
 
     def _build_intersector(self, mesh):
         if trimesh is None:
@@ -46,7 +46,8 @@ class MeshIntersectorCache:
             return None
         key = self._make_key(mesh, mesh_version)
         if key == self._key and self._intersector is not None:
-            logger.info("BVH cache: reuse (mesh_version=%s)", mesh_version)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("BVH cache: reuse (mesh_version=%s)", mesh_version)
             return self._intersector
         intersector = self._build_intersector(mesh)
         if intersector is None:
@@ -54,10 +55,10 @@ class MeshIntersectorCache:
         self._key = key
         self._intersector = intersector
         self.build_count += 1
-        face_count = 0
-        try:
-            face_count = int(len(mesh.faces))
-        except Exception:
-            face_count = 0
-        logger.info("BVH cache: built (mesh_version=%s, faces=%s)", mesh_version, face_count)
+        if logger.isEnabledFor(logging.INFO):
+            try:
+                face_count = int(len(mesh.faces))
+            except Exception:
+                face_count = 0
+            logger.info("BVH cache: built (mesh_version=%s, faces=%s)", mesh_version, face_count)
         return intersector
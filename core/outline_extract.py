@@ -9,6 +9,20 @@ except Exception:
     Polygon = None
     unary_union = None
 
+try:
+    import shapely
+
+    # Vectorized geometry API (Shapely >= 2.0).
+    _HAS_SHAPELY_ARRAYS = hasattr(shapely, "polygons") and hasattr(shapely, "get_parts")
+except Exception:
+    shapely = None
+    _HAS_SHAPELY_ARRAYS = False
+
+try:
+    from scipy.spatial import ConvexHull
+except Exception:
+    ConvexHull = None
+
 try:
     from toolpath_generator import smooth_closed_polyline, resample_polyline_ndarray
 except Exception:
@@ -24,35 +38,28 @@ def extract_outline_xy_from_triangles(tris: np.ndarray, sample_step_mm: float =
         return np.zeros((0, 2), dtype=np.float32)
 
     faces = tris.reshape(-1, 3, 3)
-    normals = np.cross(faces[:, 1] - faces[:, 0], faces[:, 2] - faces[:, 0])
-    faces = faces[normals[:, 2] > 0.0]
-    if faces.size == 0:
+    # Only the z component of the face normal decides facing; skip the full cross.
+    dx1 = faces[:, 1, 0] - faces[:, 0, 0]
+    dy1 = faces[:, 1, 1] - faces[:, 0, 1]
+    dx2 = faces[:, 2, 0] - faces[:, 0, 0]
+    dy2 = faces[:, 2, 1] - faces[:, 0, 1]
+    np.multiply(dx1, dy2, out=dx1)
+    np.multiply(dy1, dx2, out=dy1)
+    facing = dx1 > dy1
+    if not facing.any():
         return np.zeros((0, 2), dtype=np.float32)
+    if not facing.all():
+        faces = faces[facing]
 
     outline_xy: Optional[np.ndarray] = None
-    if Polygon is not None and unary_union is not None:
+    if _HAS_SHAPELY_ARRAYS:
         try:
-            polys = []
-            for face in faces:
-                poly = Polygon(face[:, :2])
-                if poly.is_valid and not poly.is_empty:
-                    polys.append(poly)
-            if polys:
-                merged = unary_union(polys)
-                outer = None
-                if isinstance(merged, Polygon):
-                    outer = merged
-                else:
-                    max_area = 0.0
-                    for g in getattr(merged, "geoms", []):
-                        if isinstance(g, Polygon):
-                            area = float(g.area)
-                            if area > max_area:
-                                max_area = area
-                                outer = g
-                if outer is not None:
-                    x, y = outer.exterior.coords.xy
-                    outline_xy = np.column_stack([x, y]).astype(np.float32)
+            outline_xy = _union_outline_arrays(faces)
+        except Exception:
+            outline_xy = None
+    elif Polygon is not None and unary_union is not None:
+        try:
+            outline_xy = _union_outline_legacy(faces)
         except Exception:
             outline_xy = None
 
@@ -70,11 +77,70 @@ def extract_outline_xy_from_triangles(tris: np.ndarray, sample_step_mm: float =
         if smooth_closed_polyline is not None and resample_polyline_ndarray is not None:
             outline_xy = smooth_closed_polyline(outline_xy)
             outline_xy = resample_polyline_ndarray(outline_xy, float(sample_step_mm))
-
-    return outline_xy.astype(np.float32, copy=False)
+            return np.asarray(outline_xy, dtype=np.float32)
+
+    # The union and hull paths already produce float32.
+    return outline_xy
+
+
+def _union_outline_arrays(faces: np.ndarray) -> Optional[np.ndarray]:
+    polys = shapely.polygons(faces[:, :, :2].astype(np.float64))
+    polys = polys[shapely.is_valid(polys) & ~shapely.is_empty(polys)]
+    if polys.size == 0:
+        return None
+    merged = shapely.unary_union(polys)
+    parts = shapely.get_parts(merged)
+    parts = parts[shapely.get_type_id(parts) == shapely.GeometryType.POLYGON]
+    if parts.size == 0:
+        return None
+    areas = shapely.area(parts)
+    idx = int(np.argmax(areas))
+    if parts.size > 1 and not areas[idx] > 0.0:
+        return None
+    ring = shapely.get_exterior_ring(parts[idx])
+    return shapely.get_coordinates(ring).astype(np.float32)
+
+
+def _union_outline_legacy(faces: np.ndarray) -> Optional[np.ndarray]:
+    polys = []
+    for face in faces:
+        poly = Polygon(face[:, :2])
+        if poly.is_valid and not poly.is_empty:
+            polys.append(poly)
+    if not polys:
+        return None
+    merged = unary_union(polys)
+    outer = None
+    if isinstance(merged, Polygon):
+        outer = merged
+    else:
+        max_area = 0.0
+        for g in getattr(merged, "geoms", []):
+            if isinstance(g, Polygon):
+                area = float(g.area)
+                if area > max_area:
+                    max_area = area
+                    outer = g
+    if outer is None:
+        return None
+    x, y = outer.exterior.coords.xy
+    return np.column_stack([x, y]).astype(np.float32)
 
 
 def _convex_hull(points_xy: np.ndarray) -> np.ndarray:
+    if ConvexHull is not None and points_xy.shape[0] >= 3:
+        try:
+            # Qhull tolerates duplicates, so the row-wise unique pass is skipped.
+            pts = np.round(np.asarray(points_xy, dtype=np.float64), 6)
+            hull = pts[ConvexHull(pts).vertices]  # counter-clockwise in 2-D
+            start = int(np.lexsort((hull[:, 1], hull[:, 0]))[0])
+            return np.roll(hull, -start, axis=0).astype(np.float32)
+        except Exception:
+            pass  # degenerate input (e.g. collinear); use the monotone chain
+    return _convex_hull_monotone(points_xy)
+
+
+def _convex_hull_monotone(points_xy: np.ndarray) -> np.ndarray:
     pts = np.unique(np.round(points_xy, 6), axis=0)
     if pts.shape[0] < 3:
         return pts.astype(np.float32)
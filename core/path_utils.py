@@ -19,6 +19,7 @@ def get_app_dir() -> Path:
     return Path(__file__).resolve().parent.parent
 
 
+@lru_cache(maxsize=None)
 def resource_path(relative: str) -> Path:
     """Resolve packaged resource path for both frozen and dev modes."""
     base = Path(sys._MEIPASS) if hasattr(sys, "_MEIPASS") else Path(__file__).resolve().parent.parent
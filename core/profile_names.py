@@ -0,0 +1,31 @@
+from typing import Dict
+
+# Every accepted knife profile spelling, keyed by profile_key(), -> canonical name.
+PROFILE_ALIASES: Dict[str, str] = {
+    "scalpel": "scalpel_pointed",
+    "scalpelpointed": "scalpel_pointed",
+    "scalpel_pointed": "scalpel_pointed",
+    "pointed": "scalpel_pointed",
+    "scalpelrounded": "scalpel_rounded",
+    "scalpel_rounded": "scalpel_rounded",
+    "rounded": "scalpel_rounded",
+    "rotarydisk": "rotary_disk",
+    "rotary_disk": "rotary_disk",
+    "disk": "rotary_disk",
+    "rotary": "rotary_disk",
+    "doner": "rotary_disk",
+    "döner": "rotary_disk",
+}
+
+DEFAULT_PROFILE = "scalpel_pointed"
+
+_KEY_TABLE = str.maketrans({"-": "_", " ": None})
+
+
+def profile_key(name: str) -> str:
+    return (name or "").strip().lower().translate(_KEY_TABLE)
+
+
+def canonical_profile(name: str) -> str:
+    key = profile_key(name)
+    return PROFILE_ALIASES.get(key, key or DEFAULT_PROFILE)
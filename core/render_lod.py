@@ -16,7 +16,8 @@ def decimate_line_strip(points: Iterable, target_max: int) -> np.ndarray:
     if target_max < 2:
         return pts[:1]
     step = int(math.ceil((n - 1) / float(target_max - 1)))
-    idx = np.arange(0, n, step, dtype=np.int32)
-    if idx[-1] != n - 1:
-        idx = np.append(idx, n - 1)
-    return pts[idx]
+    # Strided view; only copy when the last point has to be appended.
+    out = pts[::step]
+    if (n - 1) % step != 0:
+        out = np.concatenate((out, pts[-1:]))
+    return out
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, Generic, List, Optional, TypeVar
 
 
 T = TypeVar("T")
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class WarningItem:
     code: str
     message: str
@@ -29,6 +33,8 @@ def format_warning(warning: WarningItem) -> str:
     return f"{warning.code}: {warning.message}"
 
 
+# No slots here: the ``ok`` field shares its name with the ``ok`` classmethod,
+# which a slot descriptor would shadow.
 @dataclass
 class Result(Generic[T]):
     ok: bool
@@ -1,6 +1,9 @@
 import configparser
+import io
 import os
-from typing import Dict, List, Optional
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
 
 
 _NUMERIC_KEYS = {
@@ -14,14 +17,159 @@ _NUMERIC_KEYS = {
 }
 
 
+# Parsed INI files keyed by path -> (st_mtime_ns, st_size, parser), for reads
+# only. Saves always re-parse from disk, since a same-size edit within one mtime
+# tick would look unchanged; the lock also covers their read-modify-write.
+_INI_CACHE: Dict[str, Tuple[int, int, configparser.ConfigParser]] = {}
+_INI_LOCK = threading.RLock()
+
+# Read-only section maps from _parse_ini_fast, keyed like _INI_CACHE. None marks
+# a file the fast reader declined, which then goes through configparser.
+_FAST_CACHE: Dict[str, Tuple[int, int, Optional[Dict[str, Dict[str, str]]]]] = {}
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+_UNSET = object()
+
+
+def _get_cfg(path: str, key=_UNSET) -> configparser.ConfigParser:
+    # Callers that already stat'ed the file pass its key to skip a second stat.
+    if key is _UNSET:
+        key = _stat_key(path)
+    with _INI_LOCK:
+        cached = _INI_CACHE.get(path)
+        if cached is not None and key is not None and cached[:2] == key:
+            return cached[2]
+        cfg = configparser.ConfigParser()
+        if key is None:
+            _INI_CACHE.pop(path, None)
+            return cfg
+        cfg.read(path, encoding="utf-8")
+        _INI_CACHE[path] = (key[0], key[1], cfg)
+        return cfg
+
+
+def _read_cfg_fresh(path: str) -> configparser.ConfigParser:
+    # Bypasses _INI_CACHE: another writer may have changed the file without
+    # moving its (mtime, size) key.
+    cfg = configparser.ConfigParser()
+    if os.path.exists(path):
+        cfg.read(path, encoding="utf-8")
+    return cfg
+
+
+def _write_cfg(path: str, cfg: configparser.ConfigParser) -> None:
+    # Format in memory, write once to a sibling temp file and swap it in, so a
+    # crash mid-save never leaves a truncated INI behind.
+    buf = io.StringIO()
+    cfg.write(buf)
+    tmp_path = path + ".tmp"
+    with _INI_LOCK:
+        # A save may keep (mtime, size) unchanged on coarse-mtime filesystems,
+        # so drop the fast section map whether or not the write succeeds.
+        _FAST_CACHE.pop(path, None)
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(buf.getvalue())
+            os.replace(tmp_path, path)
+        except Exception:
+            _INI_CACHE.pop(path, None)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        key = _stat_key(path)
+        if key is None:
+            _INI_CACHE.pop(path, None)
+        else:
+            _INI_CACHE[path] = (key[0], key[1], cfg)
+
+
+def _parse_ini_fast(path: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """Flat ``[section]`` / ``key = value`` reader matching ConfigParser defaults.
+
+    Returns None for anything outside that subset (continuation lines,
+    interpolation, duplicates, malformed lines) so callers can fall back.
+    """
+    with open(path, "rb") as f:
+        text = f.read().decode("utf-8")
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        if raw[0] in " \t":
+            return None
+        if line[0] == "[":
+            if line[-1] != "]":
+                return None
+            name = line[1:-1]
+            if name in sections:
+                return None
+            current = sections[name] = {}
+            continue
+        if current is None:
+            return None
+        eq = line.find("=")
+        colon = line.find(":")
+        pos = eq if colon < 0 or 0 <= eq < colon else colon
+        if pos < 0:
+            return None
+        key = line[:pos].rstrip().lower()
+        value = line[pos + 1 :].lstrip()
+        if not key or key in current or "%" in value:
+            return None
+        current[key] = value
+    return sections
+
+
+def _get_sections(path: str, key: Optional[Tuple[int, int]]) -> Optional[Dict[str, Dict[str, str]]]:
+    if key is None:
+        return None
+    with _INI_LOCK:
+        cached = _FAST_CACHE.get(path)
+        if cached is not None and cached[:2] == key:
+            return cached[2]
+        try:
+            sections = _parse_ini_fast(path)
+        except (OSError, UnicodeDecodeError):
+            sections = None
+        _FAST_CACHE[path] = (key[0], key[1], sections)
+        return sections
+
+
+def _section_items(
+    path: str, section: str, key: Optional[Tuple[int, int]]
+) -> Optional[List[Tuple[str, str]]]:
+    sections = _get_sections(path, key)
+    if sections is not None:
+        if section == configparser.DEFAULTSECT or section not in sections:
+            return None
+        items = dict(sections.get(configparser.DEFAULTSECT, {}))
+        items.update(sections[section])
+        return list(items.items())
+    with _INI_LOCK:
+        cfg = _get_cfg(path, key)
+        if not cfg.has_section(section):
+            return None
+        return cfg.items(section)
+
+
 def _tool_section(tool_no: int) -> str:
     return f"Tool:{int(tool_no)}"
 
 
 def load_active_tool_no(settings_ini_path: str) -> int:
-    cfg = configparser.ConfigParser()
-    if os.path.exists(settings_ini_path):
-        cfg.read(settings_ini_path, encoding="utf-8")
+    cfg = _get_cfg(settings_ini_path)
     if cfg.has_option("Knife", "active_tool_no"):
         try:
             value = int(cfg.get("Knife", "active_tool_no"))
@@ -32,66 +180,62 @@ def load_active_tool_no(settings_ini_path: str) -> int:
 
 
 def save_active_tool_no(settings_ini_path: str, tool_no: int) -> None:
-    cfg = configparser.ConfigParser()
-    if os.path.exists(settings_ini_path):
-        cfg.read(settings_ini_path, encoding="utf-8")
-    if "Knife" not in cfg:
-        cfg["Knife"] = {}
-    cfg["Knife"]["active_tool_no"] = str(int(tool_no))
-    with open(settings_ini_path, "w", encoding="utf-8") as f:
-        cfg.write(f)
+    with _INI_LOCK:
+        cfg = _read_cfg_fresh(settings_ini_path)
+        if "Knife" not in cfg:
+            cfg["Knife"] = {}
+        cfg["Knife"]["active_tool_no"] = str(int(tool_no))
+        _write_cfg(settings_ini_path, cfg)
 
 
 def load_tool(tool_ini_path: str, tool_no: int) -> Optional[Dict[str, object]]:
-    if not os.path.exists(tool_ini_path):
+    key = _stat_key(tool_ini_path)
+    if key is None:
         return None
-    cfg = configparser.ConfigParser()
-    cfg.read(tool_ini_path, encoding="utf-8")
-    section = _tool_section(tool_no)
-    if not cfg.has_section(section):
+    items = _section_items(tool_ini_path, _tool_section(tool_no), key)
+    if items is None:
         return None
     data: Dict[str, object] = {}
-    for key, value in cfg.items(section):
-        if key in _NUMERIC_KEYS:
+    for opt, value in items:
+        if opt in _NUMERIC_KEYS:
             try:
-                data[key] = float(value)
+                data[opt] = float(value)
             except (ValueError, TypeError):
                 continue
         else:
-            data[key] = value
+            # Short values (names, materials) repeat across tools; share one object.
+            data[opt] = sys.intern(value) if len(value) < 64 else value
     return data
 
 
 def save_tool(tool_ini_path: str, tool_no: int, tool_dict: Dict[str, object]) -> None:
-    cfg = configparser.ConfigParser()
-    if os.path.exists(tool_ini_path):
-        cfg.read(tool_ini_path, encoding="utf-8")
     section = _tool_section(tool_no)
-    if section not in cfg:
-        cfg[section] = {}
-    sec = cfg[section]
-    for key, value in (tool_dict or {}).items():
-        if key in _NUMERIC_KEYS:
-            try:
-                sec[key] = f"{float(value):.3f}"
-            except (ValueError, TypeError):
-                continue
-        else:
-            sec[key] = str(value)
-    with open(tool_ini_path, "w", encoding="utf-8") as f:
-        cfg.write(f)
+    with _INI_LOCK:
+        cfg = _read_cfg_fresh(tool_ini_path)
+        if section not in cfg:
+            cfg[section] = {}
+        sec = cfg[section]
+        for key, value in (tool_dict or {}).items():
+            if key in _NUMERIC_KEYS:
+                try:
+                    sec[key] = f"{float(value):.3f}"
+                except (ValueError, TypeError):
+                    continue
+            else:
+                sec[key] = str(value)
+        _write_cfg(tool_ini_path, cfg)
 
 
 def list_tools(tool_ini_path: str) -> List[int]:
-    if not os.path.exists(tool_ini_path):
+    key = _stat_key(tool_ini_path)
+    if key is None:
         return []
-    cfg = configparser.ConfigParser()
-    cfg.read(tool_ini_path, encoding="utf-8")
-    tools: List[int] = []
-    for section in cfg.sections():
-        if section.lower().startswith("tool:"):
-            try:
-                tools.append(int(section.split(":", 1)[1]))
-            except (ValueError, IndexError):
-                continue
-    return sorted(set(t for t in tools if t > 0))
+    parsed = _get_sections(tool_ini_path, key)
+    if parsed is not None:
+        sections = [name for name in parsed if name != configparser.DEFAULTSECT]
+    else:
+        with _INI_LOCK:
+            sections = _get_cfg(tool_ini_path, key).sections()
+    # Tool numbers are unsigned decimals; isdecimal() guarantees int() will not raise.
+    numbers = (section[5:].strip() for section in sections if section[:5].lower() == "tool:")
+    return sorted({t for t in (int(n) for n in numbers if n.isdecimal()) if t > 0})
@@ -1,5 +1,5 @@
-import math
 import os
+from functools import lru_cache
 from typing import List, Tuple
 
 import numpy as np
@@ -10,7 +10,24 @@ from core.outline_extract import extract_outline_xy_from_triangles
 Point2D = Tuple[float, float]
 
 
-def load_2d_geometry(path: str) -> List[Point2D]:
+def load_2d_geometry(path: str) -> np.ndarray:
+    """Return the selected outline as an (N, 2) array (read-only when cached)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return _load_2d_geometry_uncached(path)
+    # Re-parse only when the file changes.
+    return _load_2d_geometry_cached(path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_2d_geometry_cached(path: str, mtime_ns: int, size: int) -> np.ndarray:
+    pts = _load_2d_geometry_uncached(path)
+    pts.flags.writeable = False
+    return pts
+
+
+def _load_2d_geometry_uncached(path: str) -> np.ndarray:
     ext = os.path.splitext(path)[1].lower()
     if ext == ".stl":
         return _load_stl(path)
@@ -19,32 +36,77 @@ def load_2d_geometry(path: str) -> List[Point2D]:
     raise ValueError("Desteklenmeyen dosya türü (yalnızca STL/DXF)")
 
 
-def compute_tangent_a(points_xy: List[Point2D]) -> List[float]:
-    if not points_xy or len(points_xy) < 2:
-        return []
-    angles: List[float] = []
-    for i in range(len(points_xy) - 1):
-        x0, y0 = points_xy[i]
-        x1, y1 = points_xy[i + 1]
-        dx = x1 - x0
-        dy = y1 - y0
-        angles.append(math.degrees(math.atan2(dy, dx)))
-    angles.append(angles[-1])
+def points_to_list(points_xy: np.ndarray) -> List[Point2D]:
+    # tolist() widens float32 to Python floats exactly like float() did.
+    return list(map(tuple, np.asarray(points_xy).tolist()))
+
+
+def compute_tangent_a(points_xy) -> np.ndarray:
+    """Per-point heading in degrees; float32 input stays float32."""
+    if points_xy is None or len(points_xy) < 2:
+        return np.zeros(0, dtype=np.float64)
+    return _tangent_from_deltas(_segment_deltas(points_xy))
+
+
+def _compute_path_stats(points_xy) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Headings, segment lengths and total length from one pass of deltas."""
+    if points_xy is None or len(points_xy) < 2:
+        return np.zeros(0, dtype=np.float64), np.zeros(0, dtype=np.float64), 0.0
+    d = _segment_deltas(points_xy)
+    seg = np.hypot(d[:, 0], d[:, 1])
+    return _tangent_from_deltas(d), seg, float(seg.sum(dtype=np.float64))
+
+
+def _segment_deltas(points_xy) -> np.ndarray:
+    pts = np.asarray(points_xy)
+    if pts.dtype != np.float32:
+        pts = pts.astype(np.float64, copy=False)
+    return pts[1:] - pts[:-1]
+
+
+def _tangent_from_deltas(d: np.ndarray) -> np.ndarray:
+    angles = np.empty(d.shape[0] + 1, dtype=d.dtype)
+    # Write straight into the result buffer; no per-stage temporaries.
+    head = angles[:-1]
+    np.arctan2(d[:, 1], d[:, 0], out=head)
+    np.degrees(head, out=head)
+    angles[-1] = angles[-2]
     return angles
 
 
 def build_2d_toolpath(path: str) -> dict:
-    points_xy = load_2d_geometry(path)
-    if not points_xy or len(points_xy) < 2:
-        raise RuntimeError("Geometri bulunamadı")
-    angles_a = compute_tangent_a(points_xy)
+    try:
+        st = os.stat(path)
+    except OSError:
+        points_xy, angles_a, length_mm = _build_2d_toolpath_uncached(path)
+    else:
+        # Same file, same result: reuse the points and angles from the last build.
+        points_xy, angles_a, length_mm = _build_2d_toolpath_cached(path, st.st_mtime_ns, st.st_size)
     return {
-        "points_xy": points_xy,
+        "points_xy": list(points_xy),
         "angles_a": angles_a,
+        "length_mm": length_mm,
     }
 
 
-def _load_stl(path: str) -> List[Point2D]:
+@lru_cache(maxsize=8)
+def _build_2d_toolpath_cached(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[Point2D, ...], np.ndarray, float]:
+    points_xy, angles_a, length_mm = _build_2d_toolpath_uncached(path)
+    angles_a.flags.writeable = False
+    return tuple(points_xy), angles_a, length_mm
+
+
+def _build_2d_toolpath_uncached(path: str) -> Tuple[List[Point2D], np.ndarray, float]:
+    pts = load_2d_geometry(path)
+    if pts.shape[0] < 2:
+        raise RuntimeError("Geometri bulunamadı")
+    angles_a, _seg, length_mm = _compute_path_stats(pts)
+    return points_to_list(pts), angles_a, length_mm
+
+
+def _load_stl(path: str) -> np.ndarray:
     try:
         from stl import mesh as stl_mesh
     except Exception as exc:
@@ -54,11 +116,11 @@ def _load_stl(path: str) -> List[Point2D]:
     tris = np.asarray(stl.vectors, dtype=np.float32)
     outline = extract_outline_xy_from_triangles(tris, sample_step_mm=1.0)
     if outline is None or outline.size == 0:
-        return []
-    return [(float(x), float(y)) for x, y in outline]
+        return np.zeros((0, 2), dtype=np.float32)
+    return np.asarray(outline, dtype=np.float32).reshape(-1, 2)
 
 
-def _load_dxf(path: str) -> List[Point2D]:
+def _load_dxf(path: str) -> np.ndarray:
     try:
         import ezdxf
     except Exception as exc:
@@ -66,47 +128,53 @@ def _load_dxf(path: str) -> List[Point2D]:
 
     doc = ezdxf.readfile(path)
     msp = doc.modelspace()
-    paths: List[List[Point2D]] = []
+    paths: List[np.ndarray] = []
 
-    for entity in msp:
+    # One indexed query keeps modelspace order, which decides ties in _select_best_path.
+    for entity in msp.query("LINE LWPOLYLINE POLYLINE"):
         dtype = entity.dxftype()
         if dtype == "LINE":
             start = entity.dxf.start
             end = entity.dxf.end
-            paths.append([(float(start.x), float(start.y)), (float(end.x), float(end.y))])
-        elif dtype == "LWPOLYLINE":
-            pts = [(float(x), float(y)) for x, y in entity.get_points("xy")]
-            if entity.closed and pts:
-                pts.append(pts[0])
-            if len(pts) >= 2:
-                paths.append(pts)
-        elif dtype == "POLYLINE":
-            pts = [(float(v.dxf.location.x), float(v.dxf.location.y)) for v in entity.vertices()]
-            if entity.is_closed and pts:
-                pts.append(pts[0])
-            if len(pts) >= 2:
-                paths.append(pts)
+            paths.append(np.array([(start.x, start.y), (end.x, end.y)], dtype=np.float64))
+            continue
+        if dtype == "LWPOLYLINE":
+            pts = np.asarray(entity.get_points("xy"), dtype=np.float64).reshape(-1, 2)
+            closed = entity.closed
+        else:
+            locs = [v.dxf.location for v in entity.vertices()]
+            pts = np.array([(loc.x, loc.y) for loc in locs], dtype=np.float64).reshape(-1, 2)
+            closed = entity.is_closed
+        if closed and pts.shape[0]:
+            pts = np.concatenate((pts, pts[:1]))
+        if pts.shape[0] >= 2:
+            paths.append(pts)
 
     return _select_best_path(paths)
 
 
-def _select_best_path(paths: List[List[Point2D]]) -> List[Point2D]:
+def _select_best_path(paths: List[np.ndarray]) -> np.ndarray:
     if not paths:
-        return []
+        return np.zeros((0, 2), dtype=np.float64)
     best = None
     best_score = (-1, -1.0)
     for path in paths:
-        score = (len(path), _path_length(path))
+        n = len(path)
+        # Length only breaks ties on point count; skip it for shorter paths.
+        if n < best_score[0]:
+            continue
+        score = (n, _path_length(path))
         if score > best_score:
             best = path
             best_score = score
-    return best or []
+    return best if best is not None else np.zeros((0, 2), dtype=np.float64)
 
 
-def _path_length(points: List[Point2D]) -> float:
-    total = 0.0
-    for i in range(len(points) - 1):
-        x0, y0 = points[i]
-        x1, y1 = points[i + 1]
-        total += math.hypot(x1 - x0, y1 - y0)
-    return total
+def _path_length(points: np.ndarray) -> float:
+    if len(points) < 2:
+        return 0.0
+    arr = np.asarray(points, dtype=np.float64)
+    diff = arr[1:] - arr[:-1]
+    seg = diff[:, 0]
+    np.hypot(seg, diff[:, 1], out=seg)
+    return float(seg.sum())
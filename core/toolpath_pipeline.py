@@ -36,7 +36,7 @@ class ToolpathPipeline:
         mesh_version: Optional[int] = None,
     ) -> ToolpathResult:
         cb = progress_cb or _noop_progress
-        t0 = time.perf_counter()
+        t0 = time.perf_counter_ns()
         points, gcode_text, z_stats = generate_outline_toolpath(
             gl_viewer,
             settings_tab,
@@ -48,9 +48,12 @@ class ToolpathPipeline:
             mesh_intersector_cache=mesh_intersector_cache,
             mesh_version=mesh_version,
         )
-        elapsed = time.perf_counter() - t0
+        elapsed = (time.perf_counter_ns() - t0) * 1e-9
+        # The generator already hands back a fresh list; only copy other iterables.
+        if not isinstance(points, list):
+            points = list(points) if points else []
         result = ToolpathResult(
-            points=list(points) if points else [],
+            points=points,
             gcode_text=gcode_text or "",
             z_stats=z_stats or {},
         )
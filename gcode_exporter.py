@@ -2,12 +2,26 @@ import configparser
 import logging
 import math
 import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from typing import Dict, Iterable, List, Tuple, Union
 
+import numpy as np
+
 from core.path_utils import find_or_create_config
 
 logger = logging.getLogger(__name__)
 
+# Same constant math.degrees multiplies by; saves a call per segment heading.
+_RAD2DEG = 180.0 / math.pi
+# Module-level aliases for the per-segment emit helpers (one global load each).
+_hypot = math.hypot
+_atan2 = math.atan2
+_isfinite = math.isfinite
+
 
 def _get_setting(obj, name: str, default):
     try:
@@ -41,16 +55,44 @@ def _get_a_safety_params(settings):
     }
 
 
+@lru_cache(maxsize=1)
+def _settings_path() -> Union[str, None]:
+    # Resolved once per process, like the INI_PATH constants in the tabs. A
+    # failed resolution is cached as None too; lru_cache would not cache the
+    # exception, and retrying probes and mkdirs on every _get_ini_* call.
+    try:
+        return str(find_or_create_config()[0])
+    except Exception:
+        return None
+
+
 def _read_ini() -> Union[configparser.ConfigParser, None]:
+    # The returned parser is shared between callers; treat it as read-only.
+    # The stat doubles as the existence check and the cache key; it is not
+    # cached because the settings tab may create or rewrite the file later.
+    settings_path = _settings_path()
+    if settings_path is None:
+        return None
+    try:
+        st = os.stat(settings_path)
+    except OSError:
+        return None
+    return _read_ini_cached(settings_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _read_ini_cached(settings_path: str, mtime_ns: int, size: int) -> Union[configparser.ConfigParser, None]:
     cfg = configparser.ConfigParser()
     try:
-        settings_path = str(find_or_create_config()[0])
-        if os.path.exists(settings_path):
-            cfg.read(settings_path, encoding="utf-8")
-            return cfg
+        cfg.read(settings_path, encoding="utf-8")
     except Exception:
         return None
-    return None
+    return cfg
+
+
+def _invalidate_ini_cache() -> None:
+    _settings_path.cache_clear()
+    _read_ini_cached.cache_clear()
 
 
 def _get_ini_str(section: str, option: str, fallback: str) -> str:
@@ -89,19 +131,27 @@ def _get_ini_int(section: str, option: str, fallback: int) -> int:
     return fallback
 
 
+_BOOL_WORDS = {
+    "1": True,
+    "true": True,
+    "yes": True,
+    "on": True,
+    "0": False,
+    "false": False,
+    "no": False,
+    "off": False,
+}
+
+
 def _parse_bool(val, default: Union[bool, None] = False) -> Union[bool, None]:
     if val is None:
         return default
-    if isinstance(val, bool):
+    if val is True or val is False:
         return val
     if isinstance(val, (int, float)):
         return bool(int(val))
     if isinstance(val, str):
-        text = val.strip().lower()
-        if text in ("1", "true", "yes", "on"):
-            return True
-        if text in ("0", "false", "no", "off"):
-            return False
+        return _BOOL_WORDS.get(val.strip().lower(), default)
     return default
 
 
@@ -137,7 +187,11 @@ def _get_park_params(settings) -> dict:
             enabled = _parse_bool(getattr(settings, attr), None)
             break
     if enabled is None:
-        enabled = _parse_bool(_get_ini_int("MACHINE", "use_g53_park", _get_ini_int("MACHINE", "park_enabled", 0)), False)
+        # Only consult the legacy key when the new one is absent.
+        ini_enabled = _get_ini_int("MACHINE", "use_g53_park", None)
+        if ini_enabled is None:
+            ini_enabled = _get_ini_int("MACHINE", "park_enabled", 0)
+        enabled = _parse_bool(ini_enabled, False)
 
     def _val(names, fallback):
         for name in names:
@@ -228,9 +282,12 @@ def _angle_delta_deg(a0: float, a1: float) -> float:
 
 
 def _clean_points(points: Iterable) -> Tuple[List[Tuple[float, float, float, Union[float, None]]], int]:
+    fast = _clean_points_fast(points)
+    if fast is not None:
+        return fast
     cleaned = []
     skipped = 0
-    for p in points or []:
+    for p in (list(points) if isinstance(points, np.ndarray) else points or []):
         try:
             if isinstance(p, dict):
                 x = float(p.get("x", 0.0))
@@ -257,6 +314,8 @@ def _clean_points(points: Iterable) -> Tuple[List[Tuple[float, float, float, Uni
                     except Exception:
                         a_val = None
             a_val = float(a_val) if a_val is not None else None
+            if a_val is not None and math.isnan(a_val):
+                a_val = None
             if not (math.isfinite(x) and math.isfinite(y) and math.isfinite(z)):
                 skipped += 1
                 continue
@@ -266,13 +325,186 @@ def _clean_points(points: Iterable) -> Tuple[List[Tuple[float, float, float, Uni
     return cleaned, skipped
 
 
-def _format_ax(x: float) -> str:
-    return f"{x:.3f}"
+def _clean_points_fast(points) -> Union[Tuple[List[Tuple[float, float, float, Union[float, None]]], int], None]:
+    """Fast paths of _clean_points for numeric arrays and lists of plain tuples.
 
+    Returns None for anything else (objects, dicts, ragged or non-numeric
+    rows) so the general per-point loop can handle it.
+    """
+    if isinstance(points, np.ndarray):
+        if points.ndim != 2 or points.shape[1] < 3:
+            return None
+        try:
+            arr = points.astype(np.float64, copy=False)
+        except (TypeError, ValueError):
+            return None
+        mask = np.isfinite(arr[:, :3]).all(axis=1)
+        skipped = int(arr.shape[0] - np.count_nonzero(mask))
+        kept = arr[mask] if skipped else arr
+        if arr.shape[1] > 3:
+            a_col = kept[:, 3]
+            a_list = a_col.tolist()
+            for idx in np.flatnonzero(np.isnan(a_col)).tolist():
+                a_list[idx] = None
+        else:
+            a_list = [None] * kept.shape[0]
+        return list(zip(kept[:, 0].tolist(), kept[:, 1].tolist(), kept[:, 2].tolist(), a_list)), skipped
+
+    if not (isinstance(points, (list, tuple)) and points):
+        return None
+    first_type = type(points[0])
+    if first_type not in (tuple, list):
+        return _clean_point_objects(points, first_type)
 
-def should_a_lift(prev_pt, pt, cfg):
+    # Converting a tuple list to an array and back costs more than one lean
+    # pass, so plain rows get a loop without the attribute/dict probing.
+    isfinite = math.isfinite
+    cleaned = []
+    append = cleaned.append
+    skipped = 0
     try:
-        if not cfg.get("a_lift_enabled", True):
+        for p in points:
+            if type(p) not in (tuple, list):
+                return None
+            x = float(p[0])
+            y = float(p[1])
+            z = float(p[2])
+            a_val = p[3] if len(p) > 3 else None
+            if a_val is not None:
+                a_val = float(a_val)
+                if a_val != a_val:
+                    a_val = None
+            if isfinite(x) and isfinite(y) and isfinite(z):
+                append((x, y, z, a_val))
+            else:
+                skipped += 1
+    except (TypeError, ValueError, IndexError):
+        return None
+    return cleaned, skipped
+
+
+def _clean_point_objects(points, cls) -> Union[Tuple[List[Tuple[float, float, float, Union[float, None]]], int], None]:
+    """Fast path for a list of one x/y/z/a object type (e.g. ToolpathPoint).
+
+    The type is probed once and a single attrgetter reads every point. Only
+    types without ``__getitem__`` qualify, since the general loop would try
+    ``p[3]`` for a missing A on those.
+    """
+    if issubclass(cls, dict) or hasattr(cls, "__getitem__"):
+        return None
+    first = points[0]
+    if not all(hasattr(first, name) for name in ("x", "y", "z", "a")):
+        return None
+    get_xyza = attrgetter("x", "y", "z", "a")
+    isfinite = math.isfinite
+    cleaned = []
+    append = cleaned.append
+    skipped = 0
+    try:
+        for p in points:
+            if type(p) is not cls:
+                return None
+            x, y, z, a_val = get_xyza(p)
+            x = float(x)
+            y = float(y)
+            z = float(z)
+            if a_val is not None:
+                a_val = float(a_val)
+                if a_val != a_val:
+                    a_val = None
+            if isfinite(x) and isfinite(y) and isfinite(z):
+                append((x, y, z, a_val))
+            else:
+                skipped += 1
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return cleaned, skipped
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class GCodeConfig:
+    """Every setting one G-code build needs, resolved once from settings/INI."""
+
+    safe_z: float
+    safe_z_valid: bool
+    cut_z_limit: float
+    feed_xy: float
+    feed_z: float
+    feed_travel: float
+    spindle_enabled: bool
+    spindle_use_s: bool
+    spindle_rpm: float
+    spindle_on_mcode: str
+    spindle_off_mcode: str
+    spindle_emit_off: bool
+    arc_z_eps: float
+    jump_threshold: float
+    a_lift_enabled: bool
+    a_sharp_deg: float
+    a_critical_deg: float
+    xy_small_mm: float
+    a_lift_mode: float
+    safe_z_for_a: float
+    feed_a: float
+    turn_retract_enabled: bool
+    turn_retract_threshold: float
+    a_min_step_deg: float
+    park_enabled: bool
+    park_x: float
+    park_y: float
+    park_z: float
+    park_a: Union[float, None]
+
+    @classmethod
+    def from_settings(cls, settings) -> "GCodeConfig":
+        safe_z = _get_setting(settings, "safe_z_mm", 5.0)
+        feed_xy = _get_setting(settings, "feed_xy_mm_min", 2000.0)
+        spindle = _get_spindle_params(settings)
+        a_params = _get_a_safety_params(settings)
+        turn_retract = _get_turn_retract_params(settings)
+        park = _get_park_params(settings)
+        safe_z_valid = safe_z is not None and math.isfinite(safe_z)
+        return cls(
+            safe_z=safe_z,
+            safe_z_valid=safe_z_valid,
+            # Below this Z the tool counts as cutting; NaN when safe_z is unusable.
+            cut_z_limit=safe_z - 1e-6 if safe_z_valid else math.nan,
+            feed_xy=feed_xy,
+            feed_z=_get_setting(settings, "feed_z_mm_min", 500.0),
+            feed_travel=_get_setting(settings, "feed_travel_mm_min", 4000.0),
+            spindle_enabled=bool(spindle.get("enabled", False)),
+            spindle_use_s=bool(spindle.get("use_s", False)),
+            spindle_rpm=float(spindle.get("rpm", 0.0)),
+            spindle_on_mcode=spindle.get("on", ""),
+            spindle_off_mcode=spindle.get("off", ""),
+            spindle_emit_off=bool(spindle.get("emit_off", False)),
+            arc_z_eps=_get_setting(settings, "arc_z_eps_mm", 0.005),
+            jump_threshold=_get_jump_threshold(settings),
+            a_lift_enabled=bool(a_params["a_lift_enabled"]),
+            a_sharp_deg=a_params["a_sharp_deg"],
+            a_critical_deg=a_params["a_critical_deg"],
+            xy_small_mm=a_params["xy_small_mm"],
+            a_lift_mode=a_params["a_lift_mode"],
+            safe_z_for_a=safe_z if safe_z_valid else a_params["a_lift_safe_z_mm"],
+            feed_a=a_params["feed_a_deg_min"],
+            turn_retract_enabled=bool(turn_retract.get("enabled", False)),
+            turn_retract_threshold=float(turn_retract.get("threshold_deg", 45.0)),
+            a_min_step_deg=_get_a_min_step_deg(settings),
+            park_enabled=bool(park.get("enabled", False)),
+            park_x=float(park.get("x", 0.0)),
+            park_y=float(park.get("y", 0.0)),
+            park_z=float(park.get("z", 0.0)),
+            park_a=park.get("a", None),
+        )
+
+
+def should_a_lift(prev_pt, pt, cfg: GCodeConfig):
+    try:
+        if not cfg.a_lift_enabled:
             return False, "A_DISABLED", 0.0, 0.0
         if prev_pt is None or pt is None:
             return False, "A_MISSING", 0.0, 0.0
@@ -281,16 +513,299 @@ def should_a_lift(prev_pt, pt, cfg):
         da = abs(pt[3] - prev_pt[3])
         dx = pt[0] - prev_pt[0]
         dy = pt[1] - prev_pt[1]
-        dxy = math.hypot(dx, dy)
-        if da >= cfg.get("a_critical_deg", 45.0):
-            return True, "A_CRITICAL", da, dxy
-        if da >= cfg.get("a_sharp_deg", 25.0) and dxy <= cfg.get("xy_small_mm", 0.3):
-            return True, "A_SHARP_XY_SMALL", da, dxy
+        dxy = _hypot(dx, dy)
+        reason = _a_lift_reason(da, dxy, cfg)
+        if reason is not None:
+            return True, reason, da, dxy
         return False, "OK", da, dxy
     except Exception:
         return False, "ERR", 0.0, 0.0
 
 
+def _a_lift_reason(da: float, dxy: float, cfg: GCodeConfig) -> Union[str, None]:
+    """Threshold part of should_a_lift for an already measured A/XY step."""
+    if da >= cfg.a_critical_deg:
+        return "A_CRITICAL"
+    if da >= cfg.a_sharp_deg and dxy <= cfg.xy_small_mm:
+        return "A_SHARP_XY_SMALL"
+    return None
+
+
+# Fixed preamble of every program; spindle/park/G54 lines follow it.
+_STATIC_HEADER = b"(Generated by ZYZA Toolpath)\nG21\nG90\nG17\nG94\nG40\nG49\n"
+_STATIC_HEADER_LINES = _STATIC_HEADER.count(b"\n")
+
+
+class _EmitState:
+    """Mutable output state shared by the per-segment emit helpers."""
+
+    __slots__ = (
+        "cfg",
+        "include_a",
+        "out",
+        "line_count",
+        "moves",
+        "last_motion",
+        "last_feed",
+        "last_a",
+        "cur",
+        "turn_retract_count",
+        "a_detected",
+        "a_applied",
+        "a_max_delta",
+        "a_max_delta_xy",
+    )
+
+    def __init__(self, cfg: GCodeConfig, include_a: bool):
+        self.cfg = cfg
+        self.include_a = include_a
+        # Encoded program text, one b"\n" after every line.
+        self.out = bytearray()
+        self.line_count = 0
+        self.moves = {"G0": 0, "G1": 0, "G2": 0, "G3": 0}
+        self.last_motion = None
+        self.last_feed = None
+        self.last_a = None
+        self.cur = None
+        self.turn_retract_count = 0
+        self.a_detected = 0
+        self.a_applied = 0
+        self.a_max_delta = 0.0
+        self.a_max_delta_xy = 0.0
+
+
+def _should_emit_a(state: _EmitState, target_a: Union[float, None]) -> bool:
+    # A scan against the last *emitted* A, so it cannot be precomputed from
+    # point-to-point deltas; keep the per-call work to one float and compare.
+    if target_a is None or not state.include_a:
+        return False
+    target_a = float(target_a)
+    last_a = state.last_a
+    if last_a is None or abs(target_a - last_a) >= state.cfg.a_min_step_deg:
+        state.last_a = target_a
+        return True
+    return False
+
+
+def _write_line(state: _EmitState, line: str) -> None:
+    state.out += (line + "\n").encode()
+    state.line_count += 1
+
+
+def _output_text(state: _EmitState) -> str:
+    out = state.out
+    # Lines are newline-joined, so drop the terminator after the last one.
+    if out:
+        del out[-1:]
+    return out.decode()
+
+
+def _add_raw(state: _EmitState, cmd: str, move_code: str = None) -> None:
+    _write_line(state, cmd)
+    if move_code in state.moves:
+        state.moves[move_code] += 1
+
+
+def _emit_move(state: _EmitState, motion: str, x=None, y=None, z=None, a=None, feed=None) -> None:
+    base_motion = motion or state.last_motion
+    if base_motion is None:
+        base_motion = "G1"
+    # Each word carries its leading space; the motion word (if any) goes first.
+    words = ""
+    if x is not None:
+        words += " X%.3f" % x
+    if y is not None:
+        words += " Y%.3f" % y
+    if z is not None:
+        words += " Z%.3f" % z
+    if a is not None:
+        words += " A%.3f" % a
+    if base_motion != "G0" and feed is not None:
+        last_feed = state.last_feed
+        if last_feed is None or abs(feed - last_feed) > 1e-9:
+            words += " F%.2f" % feed
+            state.last_feed = float(feed)
+    if base_motion != state.last_motion:
+        state.last_motion = base_motion
+        line = base_motion + words
+    elif motion in ("G2", "G3"):
+        line = base_motion + words
+    else:
+        line = words[1:]
+    _write_line(state, line)
+    if base_motion in state.moves:
+        state.moves[base_motion] += 1
+
+
+def _emit_park(state: _EmitState) -> None:
+    cfg = state.cfg
+    _add_raw(state, "G53 G0 Z%.3f" % cfg.park_z, "G0")
+    _add_raw(state, "G53 G0 X%.3f Y%.3f" % (cfg.park_x, cfg.park_y), "G0")
+    if cfg.park_a is not None:
+        _add_raw(state, "G53 G0 A%.3f" % cfg.park_a, "G0")
+
+
+def _ensure_at_start(state: _EmitState, start_pt) -> bool:
+    cfg = state.cfg
+    sx, sy, sz, sa = start_pt
+    cur = state.cur
+    if cur is not None:
+        if _hypot(sx - cur[0], sy - cur[1]) <= cfg.jump_threshold:
+            return False
+        _emit_move(state, "G0", z=cfg.safe_z)
+    _emit_move(state, "G0", x=sx, y=sy)
+    _emit_move(state, "G1", z=sz, a=sa if _should_emit_a(state, sa) else None, feed=cfg.feed_z)
+    state.cur = (sx, sy, sz, sa)
+    return True
+
+
+def _is_cut_active(cfg: GCodeConfig, cur_z, target_z) -> bool:
+    if not cfg.safe_z_valid:
+        return False
+    z_ref = target_z if target_z is not None else cur_z
+    if z_ref is None:
+        return False
+    return z_ref < cfg.cut_z_limit
+
+
+def _segment_heading(x0: float, y0: float, x1: float, y1: float) -> Union[float, None]:
+    dx = x1 - x0
+    dy = y1 - y0
+    if abs(dx) < 1e-9 and abs(dy) < 1e-9:
+        return None
+    return _RAD2DEG * _atan2(dy, dx)
+
+
+def _maybe_turn_retract(state: _EmitState, target_a, target_z, target_xy, heading, prev_head) -> bool:
+    cfg = state.cfg
+    if not cfg.turn_retract_enabled:
+        return False
+    if prev_head is None or heading is None:
+        return False
+    if target_z is None:
+        return False
+    cur = state.cur
+    # Also rejects an unusable safe_z, so the retract below can rely on it.
+    if not _is_cut_active(cfg, cur[2], target_z):
+        return False
+    delta_h = abs(_angle_delta_deg(prev_head, heading))
+    if delta_h < cfg.turn_retract_threshold:
+        return False
+    # Retract: Zsafe, A (if needed), XY, then plunge
+    _emit_move(state, "G0", z=cfg.safe_z)
+    new_a = cur[3] if (cur is not None and len(cur) > 3) else None
+    if target_a is not None and _should_emit_a(state, target_a):
+        _emit_move(state, "G0", a=target_a)
+        new_a = target_a
+    _emit_move(state, "G0", x=target_xy[0], y=target_xy[1])
+    _emit_move(state, "G1", z=target_z, feed=cfg.feed_z)
+    state.cur = (target_xy[0], target_xy[1], target_z, new_a)
+    state.turn_retract_count += 1
+    return True
+
+
+def _maybe_a_lift(state: _EmitState, target_a, target_z, target_xy, move_idx: int) -> bool:
+    cfg = state.cfg
+    cur = state.cur
+    if not state.include_a or cur is None:
+        return False
+    if target_a is None or cur[3] is None:
+        return False
+    xy_dist = _hypot(target_xy[0] - cur[0], target_xy[1] - cur[1])
+    delta_a = abs(target_a - cur[3])
+    state.a_max_delta = max(state.a_max_delta, delta_a)
+    state.a_max_delta_xy = max(state.a_max_delta_xy, xy_dist)
+    # Same decision as should_a_lift, reusing the deltas measured above.
+    if not cfg.a_lift_enabled:
+        return False
+    reason = _a_lift_reason(delta_a, xy_dist, cfg)
+    if reason is None:
+        return False
+    state.a_detected += 1
+    if not (cfg.a_lift_mode and cfg.safe_z_for_a is not None and _isfinite(target_z)):
+        return False
+    _add_raw(state, f"(A_LIFT reason={reason} dA={delta_a:.3f} dXY={xy_dist:.3f} idx={move_idx})")
+    _emit_move(state, "G0", z=cfg.safe_z_for_a)
+    emitted = False
+    if _should_emit_a(state, target_a):
+        _emit_move(state, "G1", a=target_a, feed=cfg.feed_a)
+        new_a = target_a
+        emitted = True
+    else:
+        new_a = cur[3]
+    _emit_move(state, "G1", z=target_z, feed=cfg.feed_z)
+    state.cur = (cur[0], cur[1], target_z, new_a)
+    if emitted:
+        state.a_applied += 1
+    return True
+
+
+def _emit_header(state: _EmitState) -> None:
+    cfg = state.cfg
+    state.out += _STATIC_HEADER
+    state.line_count += _STATIC_HEADER_LINES
+    if cfg.spindle_enabled and cfg.spindle_on_mcode:
+        if cfg.spindle_use_s:
+            _add_raw(state, f"{cfg.spindle_on_mcode} S{cfg.spindle_rpm:.0f}")
+        else:
+            _add_raw(state, str(cfg.spindle_on_mcode))
+    if cfg.park_enabled:
+        _emit_park(state)
+    _add_raw(state, "G54")
+    _emit_move(state, "G0", z=cfg.safe_z)
+
+
+def _emit_footer(state: _EmitState) -> None:
+    cfg = state.cfg
+    _emit_move(state, "G0", z=cfg.safe_z)
+    if cfg.park_enabled:
+        _emit_park(state)
+    if cfg.spindle_emit_off and cfg.spindle_enabled and cfg.spindle_off_mcode:
+        _add_raw(state, str(cfg.spindle_off_mcode))
+    _add_raw(state, "M30")
+
+
+def _empty_program_stats(state: _EmitState, arc_fallback_count: int) -> dict:
+    return {
+        "line_count": state.line_count,
+        "lines_total": state.line_count,
+        "moves_g0": state.moves["G0"],
+        "moves_g1": 0,
+        "moves_g2": 0,
+        "moves_g3": 0,
+        "arc_ok": 0,
+        "arc_fallback": arc_fallback_count,
+    }
+
+
+def _program_stats(state: _EmitState, arc_count: int, arc_fallback_count: int, bbox, min_a, max_a) -> dict:
+    moves = state.moves
+    min_x, max_x, min_y, max_y, min_z, max_z = bbox
+    return {
+        "line_count": state.line_count,
+        "lines_total": state.line_count,
+        "moves_g0": moves["G0"],
+        "moves_g1": moves["G1"],
+        "moves_g2": moves["G2"],
+        "moves_g3": moves["G3"],
+        "arc_ok": arc_count,
+        "arc_fallback": arc_fallback_count,
+        "min_x": min_x,
+        "max_x": max_x,
+        "min_y": min_y,
+        "max_y": max_y,
+        "min_z": min_z,
+        "max_z": max_z,
+        "a_lift_detected": state.a_detected,
+        "a_lift_applied": state.a_applied,
+        "a_max_delta": state.a_max_delta,
+        "a_max_delta_xy": state.a_max_delta_xy,
+        "min_a": min_a,
+        "max_a": max_a,
+        "turn_retract_applied": state.turn_retract_count,
+    }
+
+
 def build_gcode_from_segments(segments, settings, include_a: bool = False, arc_fallback_count: int = 0):
     """
     Line/Arc segment listesinden Mach3 uyumlu G-code Ç¬retir.
@@ -298,325 +813,126 @@ def build_gcode_from_segments(segments, settings, include_a: bool = False, arc_f
     - Jump tespitinde Z safe lift + rapid + tekrar inme
     - Arc: G2/G3 I/J, opsiyonel Z/A
     """
-    from toolpath_arcfit import ArcSeg, LineSeg  # local import
-
-    safe_z = _get_setting(settings, "safe_z_mm", 5.0)
-    feed_xy = _get_setting(settings, "feed_xy_mm_min", 2000.0)
-    feed_z = _get_setting(settings, "feed_z_mm_min", 500.0)
-    feed_travel = _get_setting(settings, "feed_travel_mm_min", 4000.0)
-    spindle_cfg = _get_spindle_params(settings)
-    spindle_enabled = bool(spindle_cfg.get("enabled", False))
-    spindle_use_s = bool(spindle_cfg.get("use_s", False))
-    spindle_rpm = float(spindle_cfg.get("rpm", 0.0))
-    spindle_on_mcode = spindle_cfg.get("on", "")
-    spindle_off_mcode = spindle_cfg.get("off", "")
-    spindle_emit_off = bool(spindle_cfg.get("emit_off", False))
-    arc_z_eps = _get_setting(settings, "arc_z_eps_mm", 0.005)
-    jump_threshold = _get_jump_threshold(settings)
-    a_params = _get_a_safety_params(settings)
-    safe_z_for_a = safe_z if math.isfinite(safe_z) else a_params.get("a_lift_safe_z_mm", 20.0)
-    feed_a = a_params.get("feed_a_deg_min", feed_xy)
-    turn_retract = _get_turn_retract_params(settings)
-    turn_retract_enabled = bool(turn_retract.get("enabled", False))
-    turn_retract_threshold = float(turn_retract.get("threshold_deg", 45.0))
-    turn_retract_count = 0
-    a_min_step_deg = _get_a_min_step_deg(settings)
-    park_params = _get_park_params(settings)
-    park_enabled = bool(park_params.get("enabled", False))
-    park_x = float(park_params.get("x", 0.0))
-    park_y = float(park_params.get("y", 0.0))
-    park_z = float(park_params.get("z", 0.0))
-    park_a = park_params.get("a", None)
-
-    lines: List[str] = []
-    moves = {"G0": 0, "G1": 0, "G2": 0, "G3": 0}
-    a_stats = {"detected": 0, "applied": 0, "max_deltaA": 0.0}
-    a_stats["max_deltaXY"] = 0.0
-    last_a = None
-
-    def should_emit_a(target_a: Union[float, None]) -> bool:
-        nonlocal last_a
-        if not include_a or target_a is None:
-            return False
-        if last_a is None:
-            last_a = float(target_a)
-            return True
-        if abs(float(target_a) - float(last_a)) >= a_min_step_deg:
-            last_a = float(target_a)
-            return True
-        return False
+    from toolpath_arcfit import SEG_ARC, SEG_LINE  # local import
 
-    def add_raw(cmd: str, move_code: str = None):
-        lines.append(cmd)
-        if move_code in moves:
-            moves[move_code] += 1
-
-    last_motion = None
-    last_feed = None
-
-    def emit_move(motion: str, x=None, y=None, z=None, a=None, feed=None):
-        nonlocal last_motion, last_feed
-        base_motion = motion or last_motion
-        if base_motion is None:
-            base_motion = "G1"
-        parts: List[str] = []
-        if base_motion != last_motion:
-            parts.append(base_motion)
-            last_motion = base_motion
-        else:
-            parts.append(base_motion) if motion in ("G2", "G3") else None
-        if x is not None:
-            parts.append(f"X{_format_ax(float(x))}")
-        if y is not None:
-            parts.append(f"Y{_format_ax(float(y))}")
-        if z is not None:
-            parts.append(f"Z{_format_ax(float(z))}")
-        if a is not None:
-            parts.append(f"A{_format_ax(float(a))}")
-        if base_motion != "G0" and feed is not None:
-            if last_feed is None or abs(feed - last_feed) > 1e-9:
-                parts.append(f"F{float(feed):.2f}")
-                last_feed = float(feed)
-        line = " ".join(parts)
-        lines.append(line)
-        if base_motion in moves:
-            moves[base_motion] += 1
-
-    # Header
-    add_raw("(Generated by ZYZA Toolpath)")
-    add_raw("G21")
-    add_raw("G90")
-    add_raw("G17")
-    add_raw("G94")
-    add_raw("G40")
-    add_raw("G49")
-    if spindle_enabled and spindle_on_mcode:
-        if spindle_use_s:
-            add_raw(f"{spindle_on_mcode} S{spindle_rpm:.0f}")
-        else:
-            add_raw(str(spindle_on_mcode))
-    if park_enabled:
-        add_raw(f"G53 G0 Z{_format_ax(park_z)}", "G0")
-        add_raw(f"G53 G0 X{_format_ax(park_x)} Y{_format_ax(park_y)}", "G0")
-        if park_a is not None:
-            add_raw(f"G53 G0 A{_format_ax(park_a)}", "G0")
-    add_raw("G54")
-    emit_move("G0", z=safe_z)
+    # One snapshot of every setting; nothing below touches settings or the INI.
+    cfg = GCodeConfig.from_settings(settings)
+    feed_xy = cfg.feed_xy
+    state = _EmitState(cfg, include_a)
+    moves = state.moves
+    _emit_header(state)
 
     if not segments:
-        stats = {
-            "line_count": len(lines),
-            "lines_total": len(lines),
-            "moves_g0": moves["G0"],
-            "moves_g1": 0,
-            "moves_g2": 0,
-            "moves_g3": 0,
-            "arc_ok": 0,
-            "arc_fallback": arc_fallback_count,
-        }
-        return "\n".join(lines), stats
+        return _output_text(state), _empty_program_stats(state, arc_fallback_count)
 
-    cur = None  # type: ignore
     arc_count = 0
     line_count = 0
-    xs: List[float] = []
-    ys: List[float] = []
-    zs: List[float] = []
-    a_vals: List[float] = []
-
-    def ensure_at_start(start_pt):
-        nonlocal cur
-        sx, sy, sz, sa = start_pt
-        did_reposition = False
-        if cur is None:
-            emit_move("G0", x=sx, y=sy)
-            emit_move("G1", z=sz, a=sa if should_emit_a(sa) else None, feed=feed_z)
-            cur = (sx, sy, sz, sa)
-            return True
-        gap = math.hypot(sx - cur[0], sy - cur[1])
-        if gap > jump_threshold:
-            emit_move("G0", z=safe_z)
-            emit_move("G0", x=sx, y=sy)
-            emit_move("G1", z=sz, a=sa if should_emit_a(sa) else None, feed=feed_z)
-            cur = (sx, sy, sz, sa)
-            did_reposition = True
-        return did_reposition
-
-    def is_cut_active(cur_z, target_z):
-        if safe_z is None or not math.isfinite(safe_z):
-            return False
-        z_ref = target_z if target_z is not None else cur_z
-        if z_ref is None:
-            return False
-        return z_ref < (safe_z - 1e-6)
-
+    # Running bbox of emitted segment endpoints; valid once move_idx > 0.
+    min_x = max_x = min_y = max_y = min_z = max_z = 0.0
+    min_a = max_a = None
     move_idx = 0
     prev_heading = None
 
-    def _segment_heading(x0, y0, x1, y1):
-        dx = x1 - x0
-        dy = y1 - y0
-        if abs(dx) < 1e-9 and abs(dy) < 1e-9:
-            return None
-        return math.degrees(math.atan2(dy, dx))
     for seg in segments:
         sx, sy, sz, sa = seg.p0
-        repositioned = ensure_at_start(seg.p0)
-
-        def maybe_turn_retract(target_a, target_z, target_xy, heading, prev_head):
-            nonlocal cur, turn_retract_count
-            if not turn_retract_enabled:
-                return False
-            if prev_head is None or heading is None:
-                return False
-            if target_z is None:
-                return False
-            if not is_cut_active(cur[2], target_z if cur is not None else target_z):
-                return False
-            delta_h = abs(_angle_delta_deg(prev_head, heading))
-            if delta_h < turn_retract_threshold:
-                return False
-            if safe_z is None or not math.isfinite(safe_z):
-                return False
-            # Retract: Zsafe, A (if needed), XY, then plunge
-            emit_move("G0", z=safe_z)
-            new_a = cur[3] if (cur is not None and len(cur) > 3) else None
-            if target_a is not None and should_emit_a(target_a):
-                emit_move("G0", a=target_a)
-                new_a = target_a
-            emit_move("G0", x=target_xy[0], y=target_xy[1])
-            emit_move("G1", z=target_z, feed=feed_z)
-            cur = (target_xy[0], target_xy[1], target_z, new_a)
-            turn_retract_count += 1
-            return True
-
-        def maybe_a_lift(target_a, target_z, target_xy):
-            nonlocal cur
-            if not include_a or cur is None:
-                return
-            if target_a is None or cur[3] is None:
-                return
-            dx = target_xy[0] - cur[0]
-            dy = target_xy[1] - cur[1]
-            xy_dist = math.hypot(dx, dy)
-            delta_a = abs(target_a - cur[3])
-            a_stats["max_deltaA"] = max(a_stats["max_deltaA"], delta_a)
-            a_stats["max_deltaXY"] = max(a_stats["max_deltaXY"], xy_dist)
-            lift_needed, reason, da, dxy = should_a_lift(cur, (target_xy[0], target_xy[1], target_z, target_a), a_params)
-            if lift_needed:
-                a_stats["detected"] += 1
-                if a_params.get("a_lift_mode", 1) and safe_z_for_a is not None and math.isfinite(target_z):
-                    add_raw(f"(A_LIFT reason={reason} dA={da:.3f} dXY={dxy:.3f} idx={move_idx})")
-                    emit_move("G0", z=safe_z_for_a)
-                    emitted = False
-                    if should_emit_a(target_a):
-                        emit_move("G1", a=target_a, feed=feed_a)
-                        new_a = target_a
-                        emitted = True
-                    else:
-                        new_a = cur[3]
-                    emit_move("G1", z=target_z, feed=feed_z)
-                    cur = (cur[0], cur[1], target_z, new_a)
-                    if emitted:
-                        a_stats["applied"] += 1
-                    return True
-            return False
+        _ensure_at_start(state, seg.p0)
 
-        if isinstance(seg, LineSeg):
+        # Integer tag compare instead of an isinstance chain per segment.
+        kind = getattr(seg, "kind", None)
+        if kind == SEG_LINE:
             x1, y1, z1, a1 = seg.p1
             heading = _segment_heading(sx, sy, x1, y1)
-            turn_retract_applied = maybe_turn_retract(a1, z1, (x1, y1), heading, prev_heading)
-            if not turn_retract_applied:
-                maybe_a_lift(a1, z1, (x1, y1))
-                emit_move("G1", x=x1, y=y1, z=z1, a=a1 if should_emit_a(a1) else None, feed=feed_xy)
-                cur = (x1, y1, z1, a1)
+            if not _maybe_turn_retract(state, a1, z1, (x1, y1), heading, prev_heading):
+                _maybe_a_lift(state, a1, z1, (x1, y1), move_idx)
+                emit_a = include_a and _should_emit_a(state, a1)
+                _emit_move(state, "G1", x=x1, y=y1, z=z1, a=a1 if emit_a else None, feed=feed_xy)
+                state.cur = (x1, y1, z1, a1)
                 line_count += 1
-            xs.extend([sx, x1])
-            ys.extend([sy, y1])
-            zs.extend([sz, z1])
-            if include_a:
-                if cur[3] is not None:
-                    a_vals.append(cur[3])
-                if a1 is not None:
-                    a_vals.append(a1)
-            prev_heading = heading
-        elif isinstance(seg, ArcSeg):
+        elif kind == SEG_ARC:
             x1, y1, z1, a1 = seg.p1
+            cur = state.cur
             arc_target_z = z1 if z1 is not None else (cur[2] if cur is not None else None)
             heading = _segment_heading(sx, sy, x1, y1)
-            turn_retract_applied = maybe_turn_retract(a1, arc_target_z, (x1, y1), heading, prev_heading)
-            if not turn_retract_applied:
-                maybe_a_lift(a1, arc_target_z, (x1, y1))
+            if not _maybe_turn_retract(state, a1, arc_target_z, (x1, y1), heading, prev_heading):
+                _maybe_a_lift(state, a1, arc_target_z, (x1, y1), move_idx)
+            cur = state.cur
             i_off = seg.center_xy[0] - cur[0]
             j_off = seg.center_xy[1] - cur[1]
             z_target = None
-            if abs((z1 or 0) - (cur[2] or 0)) > arc_z_eps and seg.z_mode == "interp":
+            if abs((z1 or 0) - (cur[2] or 0)) > cfg.arc_z_eps and seg.z_mode == "interp":
                 z_target = z1
             cmd = "G2" if seg.cw else "G3"
-            parts = [cmd]
-            parts.append(f"X{_format_ax(x1)}")
-            parts.append(f"Y{_format_ax(y1)}")
-            if z_target is not None:
-                parts.append(f"Z{_format_ax(z_target)}")
-            parts.append(f"I{_format_ax(i_off)}")
-            parts.append(f"J{_format_ax(j_off)}")
-            if should_emit_a(a1):
-                parts.append(f"A{_format_ax(a1)}")
-            if last_feed is None or abs(feed_xy - last_feed) > 1e-9:
-                parts.append(f"F{feed_xy:.2f}")
-                last_feed = feed_xy
-            line = " ".join(parts)
-            lines.append(line)
+            if z_target is None:
+                line = "%s X%.3f Y%.3f I%.3f J%.3f" % (cmd, x1, y1, i_off, j_off)
+            else:
+                line = "%s X%.3f Y%.3f Z%.3f I%.3f J%.3f" % (cmd, x1, y1, z_target, i_off, j_off)
+            if _should_emit_a(state, a1):
+                line += " A%.3f" % a1
+            if state.last_feed is None or abs(feed_xy - state.last_feed) > 1e-9:
+                line += " F%.2f" % feed_xy
+                state.last_feed = feed_xy
+            _write_line(state, line)
             moves[cmd] += 1
-            cur = (x1, y1, z1, a1)
+            state.cur = (x1, y1, z1, a1)
             arc_count += 1
-            xs.extend([sx, x1])
-            ys.extend([sy, y1])
-            zs.extend([sz, z1])
-            if include_a:
-                if cur[3] is not None:
-                    a_vals.append(cur[3])
-                if a1 is not None:
-                    a_vals.append(a1)
-            prev_heading = heading
         else:
             continue
+        if move_idx:
+            min_x = min(min_x, sx, x1)
+            max_x = max(max_x, sx, x1)
+            min_y = min(min_y, sy, y1)
+            max_y = max(max_y, sy, y1)
+            min_z = min(min_z, sz, z1)
+            max_z = max(max_z, sz, z1)
+        else:
+            min_x, max_x = min(sx, x1), max(sx, x1)
+            min_y, max_y = min(sy, y1), max(sy, y1)
+            min_z, max_z = min(sz, z1), max(sz, z1)
+        if include_a:
+            for a_val in (state.cur[3], a1):
+                if a_val is not None:
+                    if min_a is None:
+                        min_a = max_a = a_val
+                    else:
+                        min_a = min(min_a, a_val)
+                        max_a = max(max_a, a_val)
+        prev_heading = heading
         move_idx += 1
 
-    emit_move("G0", z=safe_z)
-    if park_enabled:
-        add_raw(f"G53 G0 Z{_format_ax(park_z)}", "G0")
-        add_raw(f"G53 G0 X{_format_ax(park_x)} Y{_format_ax(park_y)}", "G0")
-        if park_a is not None:
-            add_raw(f"G53 G0 A{_format_ax(park_a)}", "G0")
-    if spindle_emit_off and spindle_enabled and spindle_off_mcode:
-        add_raw(str(spindle_off_mcode))
-    add_raw("M30")
-
-    stats = {
-        "line_count": len(lines),
-        "lines_total": len(lines),
-        "moves_g0": moves["G0"],
-        "moves_g1": moves["G1"],
-        "moves_g2": moves["G2"],
-        "moves_g3": moves["G3"],
-        "arc_ok": arc_count,
-        "arc_fallback": arc_fallback_count,
-        "min_x": min(xs) if xs else 0.0,
-        "max_x": max(xs) if xs else 0.0,
-        "min_y": min(ys) if ys else 0.0,
-        "max_y": max(ys) if ys else 0.0,
-        "min_z": min(zs) if zs else 0.0,
-        "max_z": max(zs) if zs else 0.0,
-        "a_lift_detected": a_stats["detected"],
-        "a_lift_applied": a_stats["applied"],
-        "a_max_delta": a_stats["max_deltaA"],
-        "a_max_delta_xy": a_stats.get("max_deltaXY", 0.0),
-        "min_a": min(a_vals) if a_vals else None,
-        "max_a": max(a_vals) if a_vals else None,
-        "turn_retract_applied": turn_retract_count,
-    }
-    return "\n".join(lines), stats
+    _emit_footer(state)
+    bbox = (min_x, max_x, min_y, max_y, min_z, max_z)
+    return _output_text(state), _program_stats(state, arc_count, arc_fallback_count, bbox, min_a, max_a)
+
+
+def _build_gcode_lines_only(cleaned, settings):
+    """build_gcode_from_segments for straight G1 moves without A output.
+
+    Walks consecutive cleaned points directly instead of building a LineSeg
+    per pair; the emitted program and stats are the same.
+    """
+    cfg = GCodeConfig.from_settings(settings)
+    feed_xy = cfg.feed_xy
+    state = _EmitState(cfg, False)
+    _emit_header(state)
+
+    if len(cleaned) < 2:
+        return _output_text(state), _empty_program_stats(state, 0)
+
+    prev_heading = None
+    for p0, p1 in zip(cleaned, islice(cleaned, 1, None)):
+        _ensure_at_start(state, p0)
+        x1, y1, z1, a1 = p1
+        heading = _segment_heading(p0[0], p0[1], x1, y1)
+        if not _maybe_turn_retract(state, a1, z1, (x1, y1), heading, prev_heading):
+            _emit_move(state, "G1", x=x1, y=y1, z=z1, feed=feed_xy)
+            state.cur = p1
+        prev_heading = heading
+
+    _emit_footer(state)
+    # Every point is a segment endpoint here, so the bbox is the point cloud's.
+    xs, ys, zs = list(zip(*cleaned))[:3]
+    bbox = (min(xs), max(xs), min(ys), max(ys), min(zs), max(zs))
+    return _output_text(state), _program_stats(state, 0, 0, bbox, None, None)
 
 
 def build_gcode_from_points(points: Iterable, settings) -> Tuple[str, Dict[str, float]]:
@@ -648,8 +964,13 @@ def build_gcode_from_points(points: Iterable, settings) -> Tuple[str, Dict[str,
 
     if arc_enable and not disable_arc_due_to_a:
         try:
+            # getattr's default would be evaluated eagerly; read the INI only as fallback.
+            if hasattr(settings, "arc_max_dev_mm"):
+                arc_max_dev = settings.arc_max_dev_mm
+            else:
+                arc_max_dev = _get_ini_float("GCODE", "arc_tol_mm", None)
             params = {
-                "arc_max_dev_mm": getattr(settings, "arc_max_dev_mm", _get_ini_float("GCODE", "arc_tol_mm", None)),
+                "arc_max_dev_mm": arc_max_dev,
                 "arc_min_points": getattr(settings, "arc_min_points", None),
                 "arc_min_len_mm": getattr(settings, "arc_min_len_mm", None),
                 "arc_z_eps_mm": getattr(settings, "arc_z_eps_mm", None),
@@ -692,13 +1013,16 @@ def build_gcode_from_points(points: Iterable, settings) -> Tuple[str, Dict[str,
             logger.exception("Arc fit/gcode üretimi başarısız, G1'e fallback.")
 
     # G1 fallback (eski davranış)
-    segs = [LineSeg(cleaned[i], cleaned[i + 1]) for i in range(len(cleaned) - 1)]
-    gcode, stats = build_gcode_from_segments(
-        segs,
-        settings,
-        include_a=include_a,
-        arc_fallback_count=0,
-    )
+    if include_a:
+        segs = [LineSeg(cleaned[i], cleaned[i + 1]) for i in range(len(cleaned) - 1)]
+        gcode, stats = build_gcode_from_segments(
+            segs,
+            settings,
+            include_a=include_a,
+            arc_fallback_count=0,
+        )
+    else:
+        gcode, stats = _build_gcode_lines_only(cleaned, settings)
     stats.update(
         {
             "skipped": skipped,
@@ -45,6 +45,124 @@ if not logger.handlers:
 INI_PATH = str(find_or_create_config()[0])
 
 
+def _gen_buffer():
+    """Yeni bir GL buffer id'si dondurur; olusturulamazsa None."""
+    vbo_id = glGenBuffers(1)
+    if isinstance(vbo_id, (list, tuple)):
+        vbo_id = vbo_id[0]
+    return vbo_id or None
+
+
+# Grid cizgi siniflari: X/Y=0, 100 mm, 50 mm, 10 mm
+_GRID_CLASS_COLORS = np.array(
+    [(0.1, 0.1, 0.15), (0.25, 0.25, 0.3), (0.4, 0.4, 0.5), (0.7, 0.7, 0.75)],
+    dtype=np.float32,
+)
+# Sinif -> cizgi kalinligi grubu (glLineWidth batch icinde degismez)
+_GRID_CLASS_BATCH = np.array([0, 0, 1, 2])
+_GRID_BATCH_WIDTHS = (2.0, 1.5, 1.0)
+
+
+def _grid_line_classes(vals: np.ndarray) -> np.ndarray:
+    k = vals.astype(np.int64)
+    cls = np.full(vals.shape, 3, dtype=np.int64)
+    cls[k % 50 == 0] = 2
+    cls[k % 100 == 0] = 1
+    cls[np.abs(vals) < 0.001] = 0
+    return cls
+
+
+def _build_grid_arrays(w: float, h: float, step: float = 10.0):
+    """Tum grid cizgilerini GL_LINES icin (renk, vertex) dizilerine doker.
+
+    Cizgiler kalinlik grubuna gore siralanir; donen batch listesi
+    (line_width, first, count) uclusudur.
+    """
+    xs = np.arange(0.0, w + 0.001, step)
+    ys = np.arange(0.0, h + 0.001, step)
+    nx = xs.shape[0]
+    lines = np.empty((nx + ys.shape[0], 2, 3), dtype=np.float32)
+    lines[:, :, 2] = 0.01
+    # X yonu cizgileri: (x,0) -> (x,h)
+    lines[:nx, :, 0] = xs[:, None]
+    lines[:nx, 0, 1] = 0.0
+    lines[:nx, 1, 1] = h
+    # Y yonu cizgileri: (0,y) -> (w,y)
+    lines[nx:, 0, 0] = 0.0
+    lines[nx:, 1, 0] = w
+    lines[nx:, :, 1] = ys[:, None]
+
+    cls = np.concatenate([_grid_line_classes(xs), _grid_line_classes(ys)])
+    batch = _GRID_CLASS_BATCH[cls]
+    order = np.argsort(batch, kind="stable")
+    verts = np.ascontiguousarray(lines[order].reshape(-1, 3))
+    colors = np.ascontiguousarray(np.repeat(_GRID_CLASS_COLORS[cls[order]], 2, axis=0))
+
+    counts = np.bincount(batch, minlength=len(_GRID_BATCH_WIDTHS)) * 2
+    batches = []
+    first = 0
+    for width, count in zip(_GRID_BATCH_WIDTHS, counts.tolist()):
+        if count:
+            batches.append((width, first, count))
+        first += count
+    return colors, verts, batches
+
+
+def _ray_triangles_nearest_t(v0, e1, e2, origin, direction, eps: float = 1e-6):
+    """Vektorel Moller-Trumbore: (T,3) ucgen dizilerinde en yakin pozitif t.
+
+    v0: ucgen ilk kosesi, e1/e2: v1-v0 ve v2-v0 kenarlari. Vurus yoksa None.
+    """
+    h = np.cross(direction, e2)
+    a = np.einsum("ij,ij->i", e1, h)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f = 1.0 / a
+        s = origin - v0
+        u = f * np.einsum("ij,ij->i", s, h)
+        q = np.cross(s, e1)
+        v = f * (q @ direction)
+        t = f * np.einsum("ij,ij->i", e2, q)
+    hit = (
+        (np.abs(a) >= eps)
+        & (u >= 0.0)
+        & (u <= 1.0)
+        & (v >= 0.0)
+        & (u + v <= 1.0)
+        & (t > eps)
+    )
+    if not hit.any():
+        return None
+    return float(np.where(hit, t, np.inf).min())
+
+
+def _draw_vertex_array(mode, pts) -> None:
+    """(N,3) noktalari client-side vertex array ile tek glDrawArrays'te cizer."""
+    arr = np.ascontiguousarray(pts, dtype=np.float32)
+    if arr.ndim != 2 or arr.shape[0] == 0:
+        return
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 0, arr)
+    glDrawArrays(mode, 0, arr.shape[0])
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+
+def _valid_index_array(indices, count: int) -> np.ndarray:
+    idx = np.asarray(indices, dtype=np.int64)
+    return idx[(idx >= 0) & (idx < count)]
+
+
+def _ray_sphere_candidates(center, radius2, origin, direction) -> np.ndarray:
+    """Isinin sinir kuresine degdigi ucgenlerin indeksleri (on eleme).
+
+    direction birim vektor olmali. |w|^2 - (w.d)^2 float32'de iptal hatasi
+    tasidigi icin |w|^2 ile orantili kucuk bir pay eklenir.
+    """
+    w = center - origin
+    ww = np.einsum("ij,ij->i", w, w)
+    wd = w @ direction
+    return np.flatnonzero(ww - wd * wd <= radius2 + ww * 1e-6)
+
+
 class ToolpathRenderCache:
     def __init__(self, lod_target: int = 10000):
         self.last_toolpath_version = -1
@@ -119,10 +237,8 @@ class ToolpathRenderCache:
 
     def _create_vbo(self, vertices: np.ndarray):
         try:
-            vbo_id = glGenBuffers(1)
-            if isinstance(vbo_id, (list, tuple)):
-                vbo_id = vbo_id[0]
-            if not vbo_id:
+            vbo_id = _gen_buffer()
+            if vbo_id is None:
                 return None
             glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
             glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
@@ -151,6 +267,13 @@ class GLTableViewer(QOpenGLWidget):
         # Tabla dolu mu sadece grid mi?
         self.table_fill_enabled = True
         self.table_visible = True
+        # Grid geometri cache'i; tabla boyutu degisince yeniden kurulur
+        self._grid_key = None
+        self._grid_colors = None
+        self._grid_verts = None
+        self._grid_batches = []
+        self._grid_vbo = None
+        self._grid_vbo_key = None
 
         # Renkler (varsayÄ±lan)
         self.bg_color = (0.55, 0.55, 0.6)     # arka plan
@@ -171,6 +294,10 @@ class GLTableViewer(QOpenGLWidget):
         self.pan_x = 0.0
         self.pan_y = 0.0
         self._last_pos = QPoint()
+        # MVP cache; kamera/tabla/pencere durumu anahtar olarak tutulur
+        self._mvp_key = None
+        self._mvp_cache = None
+        self._mvp_np = None
 
         # Model rotasyonu (derece)
         self.model_rot_x = 0.0
@@ -181,6 +308,9 @@ class GLTableViewer(QOpenGLWidget):
         self.model_offset_x = 0.0
         self.model_offset_y = 0.0
         self.model_offset_z = 0.0
+        # Model -> dunya otelemesi (G54 orijini + offset) cache'i
+        self._model_translation_key = None
+        self._model_translation_cache = None
         # TakÄ±m yolu polyline (X,Y,Z) dÃ¼nya koordinatÄ±
         self.toolpath_polyline = None  # np.ndarray (N,3) veya None
         self.original_toolpath_polyline = None
@@ -227,12 +357,25 @@ class GLTableViewer(QOpenGLWidget):
 
         # STL mesh verileri
         self.mesh_vertices_original = None  # (N,3) float32
-        self.mesh_normals_original = None   # (N,3) float32
+        self.mesh_normals_original = None   # (T,3) float32 - ucgen basina bir normal
         self.mesh_vertices = None           # (N,3) float32 - dÃ¶nÃ¼ÅŸtÃ¼rÃ¼lmÃ¼ÅŸ
-        self.mesh_normals = None            # (N,3) float32 - dÃ¶nÃ¼ÅŸtÃ¼rÃ¼lmÃ¼ÅŸ
+        self.mesh_normals = None            # (T,3) float32 - dÃ¶nÃ¼ÅŸtÃ¼rÃ¼lmÃ¼ÅŸ
         self.mesh_vertex_count = 0
         self.mesh_visible = True
+        # Interleaved normal+vertex VBO; mesh_version degisince yeniden doldurulur
+        self._mesh_vbo = None
+        self._mesh_vbo_version = -1
+        # Raycast icin ucgen bazli SoA kopya (model uzayi): v0, v1-v0, v2-v0
+        self._tri_v0 = None
+        self._tri_edge1 = None
+        self._tri_edge2 = None
+        # On eleme icin ucgen sinir kuresi (merkez, yaricap^2)
+        self._tri_center = None
+        self._tri_radius2 = None
         self.axes_visible = True
+        # Eksen cizgileri icin display list; orijin/uzunluk degisince yeniden derlenir
+        self._axes_list = None
+        self._axes_key = None
 
         # Model boyutlarÄ±
         self.model_size = None  # np.array([size_x, size_y, size_z])
@@ -359,10 +502,8 @@ class GLTableViewer(QOpenGLWidget):
         h = hex_str.strip().lstrip("#")
         if len(h) != 6:
             return (0.8, 0.8, 0.8)
-        r = int(h[0:2], 16) / 255.0
-        g = int(h[2:4], 16) / 255.0
-        b = int(h[4:6], 16) / 255.0
-        return (r, g, b)
+        r, g, b = bytes.fromhex(h)
+        return (r / 255.0, g / 255.0, b / 255.0)
 
     def set_colors(self, bg_hex, table_hex, stl_hex):
         """Ayarlar sekmesinden gelen arka plan / tabla / STL rengi."""
@@ -394,10 +535,7 @@ class GLTableViewer(QOpenGLWidget):
             if color_hex.startswith("#"):
                 color_hex = color_hex[1:]
             if len(color_hex) == 6:
-                r = int(color_hex[0:2], 16) / 255.0
-                g = int(color_hex[2:4], 16) / 255.0
-                b = int(color_hex[4:6], 16) / 255.0
-                self.toolpath_color = (r, g, b)
+                self.toolpath_color = self._hex_to_rgb_f(color_hex)
         except Exception:
             logger.exception('Toolpath rengi uygulanamadi')
 
@@ -454,9 +592,8 @@ class GLTableViewer(QOpenGLWidget):
         # Vertexleri dÃ¼z diziye Ã§evir (N,3)
         verts = vectors.reshape(-1, 3)  # 3 vertex * triangle
 
-        # Normalleri her vertex iÃ§in tekrar et (N,3)
+        # Ucgen normalleri (T,3); vertex basina cogaltma VBO'ya yazarken yapilir
         tri_normals = m.normals.astype(np.float32)
-        normals = np.repeat(tri_normals, 3, axis=0)
 
         # Bounding box
         min_xyz = verts.min(axis=0)
@@ -473,7 +610,7 @@ class GLTableViewer(QOpenGLWidget):
         verts[:, 2] -= min_xyz[2]
 
         self.mesh_vertices_original = verts.astype(np.float32)
-        self.mesh_normals_original = normals.astype(np.float32)
+        self.mesh_normals_original = tri_normals
         self.mesh_vertex_count = self.mesh_vertices_original.shape[0]
         self.mesh_visible = True
 
@@ -579,25 +716,53 @@ class GLTableViewer(QOpenGLWidget):
 
         # Rotasyon sÄ±rasÄ±: X -> Y -> Z
         R = Rz @ Ry @ Rx
+        RT = np.ascontiguousarray(R.T)
 
-        verts_rot = verts @ R.T
-        norms_rot = norms @ R.T
+        # Sonuclar dogrudan float32 cikis dizilerine yazilir; astype kopyasi yok.
+        # Diziler her seferinde yeni: arka plan isleri eski referansi okuyabilir.
+        verts_rot = np.empty(verts.shape, dtype=np.float32)
+        norms_rot = np.empty(norms.shape, dtype=np.float32)
+        np.matmul(verts, RT, out=verts_rot)
+        np.matmul(norms, RT, out=norms_rot)
 
         # (Ä°leride istersen scale de eklenebilir)
         s = float(self.model_scale)
-        verts_rot *= s
+        if s != 1.0:
+            verts_rot *= s
 
         # Min Z'yi tekrar 0'a Ã§ek -> tabla yÃ¼zeyine otursun
-        min_z = np.min(verts_rot[:, 2])
-        verts_rot[:, 2] -= min_z
+        z = verts_rot[:, 2]
+        z -= z.min()
 
-        self.mesh_vertices = verts_rot.astype(np.float32)
-        self.mesh_normals = norms_rot.astype(np.float32)
+        self.mesh_vertices = verts_rot
+        self.mesh_normals = norms_rot
+        self._rebuild_soa_triangles()
+
+    def _rebuild_soa_triangles(self):
+        """mesh_vertices'ten raycast'in okudugu (T,3) v0/edge dizilerini kurar."""
+        verts = self.mesh_vertices
+        num_tris = verts.shape[0] // 3
+        tri = verts[: num_tris * 3].reshape(num_tris, 3, 3)
+        v0 = tri[:, 0, :]
+        self._tri_v0 = np.ascontiguousarray(v0)
+        self._tri_edge1 = tri[:, 1, :] - v0
+        self._tri_edge2 = tri[:, 2, :] - v0
+        center = tri.mean(axis=1)
+        d = tri - center[:, None, :]
+        self._tri_center = center
+        self._tri_radius2 = np.einsum("ijk,ijk->ij", d, d).max(axis=1)
 
     # ------------------------------------------------------
     # OpenGL temel fonksiyonlarÄ±
     # ------------------------------------------------------
     def initializeGL(self):
+        # Yeni GL context: eski buffer id'leri gecersiz
+        self._mesh_vbo = None
+        self._mesh_vbo_version = -1
+        self._grid_vbo = None
+        self._grid_vbo_key = None
+        self._axes_list = None
+        self._axes_key = None
         try:
             glClearColor(*self.bg_color, 1.0)
             glEnable(GL_DEPTH_TEST)
@@ -699,63 +864,84 @@ class GLTableViewer(QOpenGLWidget):
         """10 mm aralÄ±klarla grid, 50 ve 100 mm'de kalÄ±nlaÅŸtÄ±rÄ±lmÄ±ÅŸ Ã§izgiler."""
         if not getattr(self, "table_visible", True):
             return
-        w = self.table_width
-        h = self.table_height
-
-        step = 10.0  # 10 mm
+        key = (self.table_width, self.table_height)
+        if self._grid_key != key:
+            self._grid_colors, self._grid_verts, self._grid_batches = _build_grid_arrays(*key)
+            self._grid_key = key
+        if not self._grid_batches:
+            return
+        use_vbo = self._ensure_grid_vbo()
 
         glDisable(GL_LIGHTING)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        if use_vbo:
+            # Buffer duzeni: once tum renkler, sonra tum vertexler
+            glBindBuffer(GL_ARRAY_BUFFER, self._grid_vbo)
+            glColorPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+            glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(self._grid_colors.nbytes))
+        else:
+            glColorPointer(3, GL_FLOAT, 0, self._grid_colors)
+            glVertexPointer(3, GL_FLOAT, 0, self._grid_verts)
 
-        # X yÃ¶nÃ¼ Ã§izgileri
-        x = 0.0
-        while x <= w + 0.001:
-            if abs(x) < 0.001:
-                # X=0 Ã§izgisi (en koyu)
-                glColor3f(0.1, 0.1, 0.15)
-                glLineWidth(2.0)
-            elif int(x) % 100 == 0:
-                glColor3f(0.25, 0.25, 0.3)
-                glLineWidth(2.0)
-            elif int(x) % 50 == 0:
-                glColor3f(0.4, 0.4, 0.5)
-                glLineWidth(1.5)
-            else:
-                glColor3f(0.7, 0.7, 0.75)
-                glLineWidth(1.0)
-
-            glBegin(GL_LINES)
-            glVertex3f(x, 0.0, 0.01)
-            glVertex3f(x, h, 0.01)
-            glEnd()
-
-            x += step
-
-        # Y yÃ¶nÃ¼ Ã§izgileri
-        y = 0.0
-        while y <= h + 0.001:
-            if abs(y) < 0.001:
-                glColor3f(0.1, 0.1, 0.15)
-                glLineWidth(2.0)
-            elif int(y) % 100 == 0:
-                glColor3f(0.25, 0.25, 0.3)
-                glLineWidth(2.0)
-            elif int(y) % 50 == 0:
-                glColor3f(0.4, 0.4, 0.5)
-                glLineWidth(1.5)
-            else:
-                glColor3f(0.7, 0.7, 0.75)
-                glLineWidth(1.0)
+        for width, first, count in self._grid_batches:
+            glLineWidth(width)
+            glDrawArrays(GL_LINES, first, count)
 
-            glBegin(GL_LINES)
-            glVertex3f(0.0, y, 0.01)
-            glVertex3f(w, y, 0.01)
-            glEnd()
-
-            y += step
+        if use_vbo:
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glDisableClientState(GL_COLOR_ARRAY)
 
         glLineWidth(1.0)
         glEnable(GL_LIGHTING)
 
+    def _ensure_grid_vbo(self) -> bool:
+        """Grid VBO'sunu sadece tabla boyutu degistiginde yeniden yukler."""
+        if self._grid_vbo_key == self._grid_key:
+            return self._grid_vbo is not None
+        self._grid_vbo_key = self._grid_key
+        try:
+            if self._grid_vbo is None:
+                self._grid_vbo = _gen_buffer()
+                if self._grid_vbo is None:
+                    return False
+            buf = np.concatenate([self._grid_colors.ravel(), self._grid_verts.ravel()])
+            glBindBuffer(GL_ARRAY_BUFFER, self._grid_vbo)
+            glBufferData(GL_ARRAY_BUFFER, buf.nbytes, buf, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            return True
+        except Exception:
+            logger.exception("Grid VBO yuklenemedi")
+            if self._grid_vbo is not None:
+                try:
+                    glDeleteBuffers(1, [self._grid_vbo])
+                except Exception:
+                    pass
+                self._grid_vbo = None
+            return False
+
+    def _model_translation(self) -> np.ndarray:
+        """Model uzayindan dunyaya oteleme (G54 orijini + kullanici offseti)."""
+        key = (
+            self.origin_mode,
+            self.table_width,
+            self.table_height,
+            self.model_offset_x,
+            self.model_offset_y,
+            self.model_offset_z,
+        )
+        if key != self._model_translation_key:
+            ox, oy = self._compute_origin_point()
+            tr = np.array(
+                [ox + self.model_offset_x, oy + self.model_offset_y, self.model_offset_z],
+                dtype=np.float32,
+            )
+            tr.setflags(write=False)
+            self._model_translation_cache = tr
+            self._model_translation_key = key
+        return self._model_translation_cache
+
     def _compute_origin_point(self):
         """G54 orijin noktasÄ±nÄ±n tablo Ã¼zerindeki (x,y) koordinatÄ±."""
         w = self.table_width
@@ -783,6 +969,34 @@ class GLTableViewer(QOpenGLWidget):
         axis_len *= 1.5  # OklarÄ± %50 uzat
 
         glDisable(GL_LIGHTING)
+        key = (ox, oy, axis_len)
+        if self._axes_list is None or self._axes_key != key:
+            self._compile_axes_list(ox, oy, axis_len)
+            self._axes_key = key
+        glCallList(self._axes_list)
+
+        # Eksen harflerini uca yaz
+        def _draw_label(text, x, y, z, color):
+            glColor3f(*color)
+            glRasterPos3f(x, y, z)
+            for ch in text:
+                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+
+        _draw_label("X", ox + axis_len + 6.0, oy, 0.0, (1.0, 0.0, 0.0))
+        _draw_label("Y", ox, oy + axis_len + 6.0, 0.0, (0.0, 0.8, 0.0))
+        _draw_label("Z", ox, oy, axis_len + 6.0, (0.0, 0.0, 1.0))
+
+        glLineWidth(1.0)
+
+        # Basit ok uÃ§larÄ± Ã§izilebilir; ÅŸimdilik sadece Ã§izgi yeterli.
+
+        glEnable(GL_LIGHTING)
+
+    def _compile_axes_list(self, ox, oy, axis_len):
+        """Eksen cizgilerini display list'e derler (harfler her karede ayri cizilir)."""
+        if self._axes_list is None:
+            self._axes_list = glGenLists(1)
+        glNewList(self._axes_list, GL_COMPILE)
         glLineWidth(6.0)
 
         # X ekseni (kÄ±rmÄ±zÄ±)
@@ -805,23 +1019,7 @@ class GLTableViewer(QOpenGLWidget):
         glVertex3f(ox, oy, 0.0)
         glVertex3f(ox, oy, axis_len)
         glEnd()
-
-        # Eksen harflerini uca yaz
-        def _draw_label(text, x, y, z, color):
-            glColor3f(*color)
-            glRasterPos3f(x, y, z)
-            for ch in text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
-
-        _draw_label("X", ox + axis_len + 6.0, oy, 0.0, (1.0, 0.0, 0.0))
-        _draw_label("Y", ox, oy + axis_len + 6.0, 0.0, (0.0, 0.8, 0.0))
-        _draw_label("Z", ox, oy, axis_len + 6.0, (0.0, 0.0, 1.0))
-
-        glLineWidth(1.0)
-
-        # Basit ok uÃ§larÄ± Ã§izilebilir; ÅŸimdilik sadece Ã§izgi yeterli.
-
-        glEnable(GL_LIGHTING)
+        glEndList()
 
     def _draw_mesh(self):
         if not getattr(self, "mesh_visible", True):
@@ -833,21 +1031,25 @@ class GLTableViewer(QOpenGLWidget):
         ):
             return
 
-        ox, oy = self._compute_origin_point()
+        tx, ty, tz = self._model_translation().tolist()
 
         glPushMatrix()
 
         # G54 orijinine ve kullanÄ±cÄ± offset'ine taÅŸÄ±
-        glTranslatef(
-            ox + self.model_offset_x,
-            oy + self.model_offset_y,
-            self.model_offset_z,
-        )
+        glTranslatef(tx, ty, tz)
 
+        use_vbo = self._ensure_mesh_vbo()
         glEnableClientState(GL_NORMAL_ARRAY)
         glEnableClientState(GL_VERTEX_ARRAY)
-        glNormalPointer(GL_FLOAT, 0, self.mesh_normals)
-        glVertexPointer(3, GL_FLOAT, 0, self.mesh_vertices)
+        if use_vbo:
+            # Satir basina 6 float: nx ny nz x y z
+            glBindBuffer(GL_ARRAY_BUFFER, self._mesh_vbo)
+            glNormalPointer(GL_FLOAT, 24, ctypes.c_void_p(0))
+            glVertexPointer(3, GL_FLOAT, 24, ctypes.c_void_p(12))
+        else:
+            # VBO yoksa (nadir) normaller her karede vertex basina cogaltilir
+            glNormalPointer(GL_FLOAT, 0, np.repeat(self.mesh_normals, 3, axis=0))
+            glVertexPointer(3, GL_FLOAT, 0, self.mesh_vertices)
 
         glEnable(GL_CULL_FACE)
 
@@ -863,11 +1065,42 @@ class GLTableViewer(QOpenGLWidget):
 
         glDisable(GL_CULL_FACE)
 
+        if use_vbo:
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
         glDisableClientState(GL_VERTEX_ARRAY)
         glDisableClientState(GL_NORMAL_ARRAY)
 
         glPopMatrix()
 
+    def _ensure_mesh_vbo(self) -> bool:
+        """Mesh VBO'sunu sadece mesh_version degistiginde yeniden yukler."""
+        if self._mesh_vbo_version == self.mesh_version:
+            return self._mesh_vbo is not None
+        self._mesh_vbo_version = self.mesh_version
+        try:
+            if self._mesh_vbo is None:
+                self._mesh_vbo = _gen_buffer()
+                if self._mesh_vbo is None:
+                    return False
+            buf = np.empty((self.mesh_vertex_count, 6), dtype=np.float32)
+            # Ucgen normalini ucgenin 3 vertexine yay (np.repeat kopyasi olmadan)
+            buf.reshape(-1, 3, 6)[:, :, 0:3] = self.mesh_normals[:, None, :]
+            buf[:, 3:6] = self.mesh_vertices
+            glBindBuffer(GL_ARRAY_BUFFER, self._mesh_vbo)
+            glBufferData(GL_ARRAY_BUFFER, buf.nbytes, buf, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            return True
+        except Exception:
+            # Bu mesh icin client-side dizilere geri don
+            logger.exception("Mesh VBO yuklenemedi")
+            if self._mesh_vbo is not None:
+                try:
+                    glDeleteBuffers(1, [self._mesh_vbo])
+                except Exception:
+                    pass
+                self._mesh_vbo = None
+            return False
+
     def _draw_camera_overlay(self):
         """EkranÄ±n sol Ã¼stÃ¼ne kamera aÃ§Ä±larÄ±nÄ± yaz."""
         w = self.width()
@@ -925,7 +1158,32 @@ class GLTableViewer(QOpenGLWidget):
         return proj
 
     def _mvp_matrix(self) -> QMatrix4x4:
-        return self._build_proj_matrix() * self._build_view_matrix()
+        # Kamera alanlari bircok yerden dogrudan yaziliyor; gecersiz kilmak
+        # yerine durumu anahtar olarak karsilastir.
+        key = (
+            self.dist,
+            self.rot_x,
+            self.rot_y,
+            self.pan_x,
+            self.pan_y,
+            self.table_width,
+            self.table_height,
+            self.width(),
+            self.height(),
+        )
+        if key != self._mvp_key:
+            self._mvp_cache = self._build_proj_matrix() * self._build_view_matrix()
+            self._mvp_np = None
+            self._mvp_key = key
+        return self._mvp_cache
+
+    def _mvp_array(self) -> np.ndarray:
+        """MVP matrisi (4,4) satir-oncelikli numpy dizisi olarak."""
+        mvp = self._mvp_matrix()
+        if self._mvp_np is None:
+            # QMatrix4x4.data() sutun-oncelikli
+            self._mvp_np = np.array(mvp.data(), dtype=np.float64).reshape(4, 4).T
+        return self._mvp_np
 
     def _project_point_to_screen(self, pt: np.ndarray):
         """DÃ¼nyadaki bir noktayÄ± ekran koordinatÄ±na Ã§evirir."""
@@ -940,11 +1198,16 @@ class GLTableViewer(QOpenGLWidget):
     def _project_polyline_to_screen(self) -> Optional[np.ndarray]:
         if self.toolpath_polyline is None:
             return None
-        pts_2d = []
-        for pt in self.toolpath_polyline:
-            sx, sy, _ = self._project_point_to_screen(pt)
-            pts_2d.append((sx, sy))
-        return np.array(pts_2d, dtype=np.float32)
+        mvp = self._mvp_array()
+        clip = self.toolpath_polyline @ mvp[:, :3].T + mvp[:, 3]
+        w = max(1, self.width())
+        h = max(1, self.height())
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ndc = clip[:, :2] / clip[:, 3:4]
+        pts_2d = np.empty((clip.shape[0], 2), dtype=np.float32)
+        pts_2d[:, 0] = (ndc[:, 0] + 1.0) * 0.5 * w
+        pts_2d[:, 1] = (1.0 - (ndc[:, 1] + 1.0) * 0.5) * h
+        return pts_2d
 
     def _unproject_ray(self, screen_x: float, screen_y: float):
         """Ekran noktasÄ±ndan dÃ¼nyaya giden Ã§izgi (near->far)."""
@@ -993,45 +1256,23 @@ class GLTableViewer(QOpenGLWidget):
             return None
         direction /= norm
 
-        verts = self.mesh_vertices
-        # Model, Ã§izimde G54 orijini + offset ile taÅŸÄ±nÄ±yor
-        ox, oy = self._compute_origin_point()
-        tx = ox + self.model_offset_x
-        ty = oy + self.model_offset_y
-        tz = self.model_offset_z
-
-        closest_t = None
-        closest_hit = None
+        if self._tri_v0 is None:
+            self._rebuild_soa_triangles()
+        # Model, Ã§izimde G54 orijini + offset ile taÅŸÄ±nÄ±yor. Ucgenleri
+        # otelemek yerine isini model uzayina al; t degismez.
+        local_origin = origin - self._model_translation()
+        # Sinir kuresi testini gecemeyen ucgenler tam testten cikarilir
+        idx = _ray_sphere_candidates(self._tri_center, self._tri_radius2, local_origin, direction)
+        if idx.size == 0:
+            return None
 
         # MÃ¶llerâ€“Trumbore
-        eps = 1e-6
-        for i in range(0, self.mesh_vertex_count - 2, 3):
-            v0 = verts[i] + np.array([tx, ty, tz], dtype=np.float32)
-            v1 = verts[i + 1] + np.array([tx, ty, tz], dtype=np.float32)
-            v2 = verts[i + 2] + np.array([tx, ty, tz], dtype=np.float32)
-
-            edge1 = v1 - v0
-            edge2 = v2 - v0
-            h = np.cross(direction, edge2)
-            a = np.dot(edge1, h)
-            if -eps < a < eps:
-                continue
-            f = 1.0 / a
-            s = origin - v0
-            u = f * np.dot(s, h)
-            if u < 0.0 or u > 1.0:
-                continue
-            q = np.cross(s, edge1)
-            v = f * np.dot(direction, q)
-            if v < 0.0 or u + v > 1.0:
-                continue
-            t = f * np.dot(edge2, q)
-            if t > eps:
-                if closest_t is None or t < closest_t:
-                    closest_t = t
-                    closest_hit = origin + direction * t
-
-        return closest_hit
+        t = _ray_triangles_nearest_t(
+            self._tri_v0[idx], self._tri_edge1[idx], self._tri_edge2[idx], local_origin, direction
+        )
+        if t is None:
+            return None
+        return origin + direction * t
 
     def set_toolpath_polyline(self, points: Optional[np.ndarray]):
         """DÄ±ÅŸarÄ±dan takÄ±m yolu polyline'Ä± verilir (X,Y,Z)."""
@@ -1104,6 +1345,9 @@ class GLTableViewer(QOpenGLWidget):
     def set_mesh_data(self, vertices, normals, size_xyz):
         """Arka planda hazırlanan mesh verisini UI thread'inde uygular."""
         self.mesh_vertices_original = vertices
+        if normals is not None and vertices is not None and normals.shape[0] == vertices.shape[0]:
+            # Vertex basina cogaltilmis normaller -> ucgen basina
+            normals = normals[::3]
         self.mesh_normals_original = normals
         self.mesh_vertex_count = 0 if vertices is None else vertices.shape[0]
         self.model_size = size_xyz
@@ -1419,7 +1663,8 @@ class GLTableViewer(QOpenGLWidget):
         glLineWidth(self.toolpath_width)
         r, g, b = self.toolpath_color
         glColor3f(r, g, b)
-        if vbo_id and vbo_count >= 2:
+        use_vbo = bool(vbo_id) and vbo_count >= 2
+        if use_vbo:
             glEnableClientState(GL_VERTEX_ARRAY)
             glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
             glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
@@ -1427,20 +1672,14 @@ class GLTableViewer(QOpenGLWidget):
             glBindBuffer(GL_ARRAY_BUFFER, 0)
             glDisableClientState(GL_VERTEX_ARRAY)
         else:
-            glBegin(GL_LINE_STRIP)
-            for x, y, z in line_pts:
-                glVertex3f(float(x), float(y), float(z))
-            glEnd()
+            _draw_vertex_array(GL_LINE_STRIP, line_pts)
 
         # Orijinal yolu ince Ã§izgi olarak Ã§iz
         if self.show_original_toolpath and self.original_toolpath_polyline is not None:
             glDisable(GL_LIGHTING)
             glLineWidth(1.0)
             glColor3f(1.0, 0.0, 1.0)
-            glBegin(GL_LINE_STRIP)
-            for x, y, z in self.original_toolpath_polyline:
-                glVertex3f(float(x), float(y), float(z))
-            glEnd()
+            _draw_vertex_array(GL_LINE_STRIP, self.original_toolpath_polyline)
 
         # Nokta ve marker katmanÄ±
         glDisable(GL_LIGHTING)
@@ -1450,13 +1689,19 @@ class GLTableViewer(QOpenGLWidget):
         pr, pg, pb = getattr(self, "point_color", (1.0, 1.0, 0.0))
         glPointSize(base_point_size)
         glColor3f(pr, pg, pb)
-        glBegin(GL_POINTS)
-        point_pts = pts
-        if not self.pivot_preview_enabled or self._pivot_preview_polyline is None:
-            point_pts = line_pts
-        for x, y, z in point_pts:
-            glVertex3f(float(x), float(y), float(z))
-        glEnd()
+        if use_vbo:
+            # VBO cizgiyle ayni noktalari (full/LOD) tutuyor
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+            glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+            glDrawArrays(GL_POINTS, 0, vbo_count)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glDisableClientState(GL_VERTEX_ARRAY)
+        else:
+            point_pts = pts
+            if not self.pivot_preview_enabled or self._pivot_preview_polyline is None:
+                point_pts = line_pts
+            _draw_vertex_array(GL_POINTS, point_pts)
         glPointSize(1.0)
 
         # HatalÄ± noktalar / 1. nokta rengi
@@ -1464,12 +1709,7 @@ class GLTableViewer(QOpenGLWidget):
         if getattr(self, "issue_indices", None):
             glPointSize(base_point_size + 1.0)
             glColor3f(*issue_color)
-            glBegin(GL_POINTS)
-            for idx in self.issue_indices:
-                if 0 <= idx < len(pts):
-                    x, y, z = pts[idx]
-                    glVertex3f(float(x), float(y), float(z))
-            glEnd()
+            _draw_vertex_array(GL_POINTS, pts[_valid_index_array(self.issue_indices, len(pts))])
             glPointSize(1.0)
 
         # SeÃ§ili 1. ve 2. noktalar
@@ -1496,12 +1736,7 @@ class GLTableViewer(QOpenGLWidget):
         if getattr(self, "z_anchor_indices", None):
             glPointSize(max(base_point_size + 2.0, 8.0))
             glColor3f(*self.z_anchor_color)
-            glBegin(GL_POINTS)
-            for idx in self.z_anchor_indices:
-                if 0 <= idx < len(pts):
-                    x, y, z = pts[idx]
-                    glVertex3f(float(x), float(y), float(z))
-            glEnd()
+            _draw_vertex_array(GL_POINTS, pts[_valid_index_array(self.z_anchor_indices, len(pts))])
             glPointSize(1.0)
 
         # STL Ã¼zerinde vurulan nokta marker'larÄ± ve baÄŸlantÄ± Ã§izgileri
@@ -422,7 +422,6 @@ class TabModel(QWidget):
         num_triangles = vectors.shape[0]
         verts = vectors.reshape(-1, 3)
         tri_normals = m.normals.astype(np.float32)
-        normals = np.repeat(tri_normals, 3, axis=0)
         min_xyz = verts.min(axis=0)
         max_xyz = verts.max(axis=0)
         size_xyz = max_xyz - min_xyz
@@ -433,7 +432,7 @@ class TabModel(QWidget):
         worker.signals.progress.emit("Veri hazır", 90)
         return {
             "vertices": verts.astype(np.float32),
-            "normals": normals.astype(np.float32),
+            "normals": tri_normals,
             "size": size_xyz.astype(np.float32),
             "triangles": num_triangles,
             "path": filename,
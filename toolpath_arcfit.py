@@ -1,18 +1,23 @@
 import logging
 import math
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from typing import ClassVar, Dict, List, Optional, Sequence, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 
 Point = Tuple[float, float, float, Optional[float]]
 
+# Segment type tags; consumers compare ``seg.kind`` instead of isinstance chains.
+SEG_LINE = 0
+SEG_ARC = 1
+
 
 @dataclass
 class LineSeg:
     p0: Point
     p1: Point
+    kind: ClassVar[int] = SEG_LINE
 
 
 @dataclass
@@ -27,6 +32,7 @@ class ArcSeg:
     z1: float
     start_ang: float
     end_ang: float
+    kind: ClassVar[int] = SEG_ARC
 
 
 @dataclass
@@ -9,8 +9,8 @@ from OpenGL.GLU import gluPerspective
 
 from toolpath_gcode_parser import GcodeSegment
 from tool_model import ToolVisualConfig
-from core.knife_catalog import load_catalog
-from core.knife_mesh import build_knife_mesh
+from core.knife_catalog import knife_by_id, load_catalog
+from core.knife_mesh import build_knife_mesh, mesh_part_arrays
 from core.knife_orientation import preview_orientation, compute_tool_pose
 from core.tool_library import load_active_tool_no, load_tool
 from core.path_utils import find_or_create_config
@@ -173,9 +173,9 @@ class GCodeViewer3D(QOpenGLWidget):
             return profile
         knife_id = str(tool_data.get("knife_id", "") or "").strip()
         if knife_id:
-            for knife in load_catalog():
-                if knife.id == knife_id:
-                    return knife.kind
+            knife = knife_by_id(knife_id)
+            if knife is not None:
+                return knife.kind
         return "scalpel_pointed"
 
     def _to_vertex_list(self, verts) -> List[Tuple[float, float, float]]:
@@ -221,11 +221,11 @@ class GCodeViewer3D(QOpenGLWidget):
             except Exception:
                 pass
         mesh = build_knife_mesh(profile, params)
-        body = mesh.get("body", (None, None))
-        blade = mesh.get("blade", (None, None))
+        body = mesh.get("body")
+        blade = mesh.get("blade")
         tip = mesh.get("tip", (0.0, 0.0, 0.0))
-        body_verts = body[0] if isinstance(body, (list, tuple)) and len(body) > 0 else None
-        blade_verts = blade[0] if isinstance(blade, (list, tuple)) and len(blade) > 0 else None
+        body_verts = mesh_part_arrays(body)[0] if body is not None else None
+        blade_verts = mesh_part_arrays(blade)[0] if blade is not None else None
         self._tool_mesh_body = self._to_vertex_list(body_verts)
         self._tool_mesh_blade = self._to_vertex_list(blade_verts)
         try:
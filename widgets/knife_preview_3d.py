@@ -1,3 +1,4 @@
+import ctypes
 import math
 from typing import Any, Dict, Optional, Tuple
 
@@ -180,33 +181,37 @@ class KnifePreview3DWidget(QOpenGLWidget):
         self._draw_axis_gizmo(self.width(), self.height())
 
     def _draw_mesh(self):
-        body = self._mesh.get("body", (np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.float32)))
-        blade = self._mesh.get("blade", (np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.float32)))
-        kerf = self._mesh.get("kerf", (np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.float32)))
+        empty = np.zeros((0, 6), dtype=np.float32)
+        body = self._mesh.get("body", empty)
+        blade = self._mesh.get("blade", empty)
+        kerf = self._mesh.get("kerf", empty)
 
-        self._draw_arrays(body[0], body[1], (0.65, 0.66, 0.7, 1.0))
-        self._draw_arrays(blade[0], blade[1], (0.84, 0.84, 0.9, 1.0))
+        self._draw_arrays(body, (0.65, 0.66, 0.7, 1.0))
+        self._draw_arrays(blade, (0.84, 0.84, 0.9, 1.0))
 
-        if kerf[0].size > 0:
+        if kerf.size > 0:
             glEnable(GL_BLEND)
             glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
             glDisable(GL_LIGHTING)
-            self._draw_arrays(kerf[0], kerf[1], (1.0, 0.7, 0.25, 0.25), use_lighting=False)
+            self._draw_arrays(kerf, (1.0, 0.7, 0.25, 0.25), use_lighting=False)
             glEnable(GL_LIGHTING)
             glDisable(GL_BLEND)
 
-    def _draw_arrays(self, verts: np.ndarray, norms: np.ndarray, color, use_lighting: bool = True):
-        if verts.size == 0:
+    def _draw_arrays(self, vn: np.ndarray, color, use_lighting: bool = True):
+        # vn rows are interleaved x, y, z, nx, ny, nz float32 (24-byte stride).
+        if vn.size == 0:
             return
+        vn = np.ascontiguousarray(vn, dtype=np.float32)
+        stride = vn.strides[0]
         glColor4f(*color)
         glEnableClientState(GL_VERTEX_ARRAY)
-        glVertexPointer(3, GL_FLOAT, 0, verts)
-        if use_lighting and norms is not None and norms.size == verts.size:
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(vn.ctypes.data))
+        if use_lighting:
             glEnableClientState(GL_NORMAL_ARRAY)
-            glNormalPointer(GL_FLOAT, 0, norms)
+            glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(vn.ctypes.data + 3 * vn.itemsize))
         else:
             glDisableClientState(GL_NORMAL_ARRAY)
-        glDrawArrays(GL_TRIANGLES, 0, int(verts.shape[0]))
+        glDrawArrays(GL_TRIANGLES, 0, int(vn.shape[0]))
         glDisableClientState(GL_VERTEX_ARRAY)
         glDisableClientState(GL_NORMAL_ARRAY)
 